@@ -16,7 +16,7 @@ from datetime import datetime
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QLabel, QLineEdit,
                              QTextEdit, QGroupBox, QMessageBox, QTabWidget,
-                             QRadioButton, QButtonGroup, QFileDialog)
+                             QRadioButton, QButtonGroup, QFileDialog, QCheckBox)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 
@@ -97,7 +97,7 @@ class DatabaseWorker(QThread):
 
         self.progress.emit(f"Precheck report generated: {report_path}")
 
-        all_passed = all(r['status'] == 'PASS' for r in validation_results if r['status'] != 'SKIPPED')
+        all_passed = all(r.status == 'PASS' for r in validation_results if r.status != 'SKIPPED')
         status = "All checks PASSED" if all_passed else "Some checks FAILED"
 
         return f"PDB clone precheck completed.\nStatus: {status}\nReport: {report_path}"
@@ -133,7 +133,7 @@ class DatabaseWorker(QThread):
 
         self.progress.emit(f"Postcheck report generated: {report_path}")
 
-        all_passed = all(r['status'] == 'PASS' for r in validation_results)
+        all_passed = all(r.status == 'PASS' for r in validation_results)
         status = "All checks PASSED" if all_passed else "Some checks FAILED"
 
         return f"PDB clone postcheck completed.\nStatus: {status}\nReport: {report_path}"
@@ -300,6 +300,7 @@ class DatabaseWorker(QThread):
 
 class OraclePDBToolkit(QMainWindow):
     """Main application window"""
+    log_signal = pyqtSignal(str)
 
     def __init__(self):
         super().__init__()
@@ -346,6 +347,8 @@ class OraclePDBToolkit(QMainWindow):
         output_layout.addWidget(self.output_text)
         output_group.setLayout(output_layout)
         main_layout.addWidget(output_group)
+        # Queued so log lines are appended by the event loop rather than forcing a pump per line
+        self.log_signal.connect(self._append_log, Qt.ConnectionType.QueuedConnection)
 
         self.log("Oracle PDB Toolkit initialized successfully")
         self.log("Note: Supports both external authentication and username/password")
@@ -813,6 +816,11 @@ class OraclePDBToolkit(QMainWindow):
 
         layout.addLayout(test_button_layout)
 
+        # Precheck option: write the DBMS_PDB.DESCRIBE XML next to the reports
+        self.describe_xml_checkbox = QCheckBox("Export DBMS_PDB.DESCRIBE XML during precheck")
+        self.describe_xml_checkbox.setChecked(True)
+        layout.addWidget(self.describe_xml_checkbox)
+
         # Action buttons
         button_layout = QHBoxLayout()
 
@@ -837,8 +845,11 @@ class OraclePDBToolkit(QMainWindow):
     def log(self, message):
         """Add message to output area"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.output_text.append(f"[{timestamp}] {message}")
-        QApplication.processEvents()
+        self.log_signal.emit(f"[{timestamp}] {message}")
+
+    def _append_log(self, line):
+        """Append a formatted log line to the output area (GUI thread)"""
+        self.output_text.append(line)
 
     def disable_buttons(self):
         """Disable all action buttons during operations"""
@@ -1089,7 +1100,8 @@ class OraclePDBToolkit(QMainWindow):
             'target_scan': target_scan,
             'target_port': target_port,
             'target_cdb': target_cdb,
-            'target_pdb': target_pdb
+            'target_pdb': target_pdb,
+            'debug_dump_xml': self.describe_xml_checkbox.isChecked()
         }
 
         # Add credentials if username/password mode
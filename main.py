@@ -19,8 +19,7 @@ Usage:
 import sys
 import signal
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
-from utils.helper_functions import init_oracle_client_thick_mode
+from utils.helper_functions import init_oracle_client_thick_mode, install_signal_wakeup
 from admin_toolbox_qt import OraclePDBToolkit
 
 
@@ -63,17 +62,16 @@ def main():
     print("=" * 80)
     print()
 
-    # Register signal handler for Ctrl+C
+    # Register signal handler for Ctrl+C, and for SIGTERM (kill, service managers)
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
 
     # Create Qt Application
     app = QApplication(sys.argv)
 
-    # Create a QTimer that fires periodically to allow Python to process signals
-    # This is necessary because Qt's event loop blocks Python's signal handling
-    timer = QTimer()
-    timer.start(500)  # Fire every 500ms
-    timer.timeout.connect(lambda: None)  # No-op, just allows Python signal processing
+    # Wake the event loop on signal delivery so the Python handler runs
+    # (Qt's event loop otherwise blocks Python's signal handling)
+    install_signal_wakeup(app)
 
     # Create and show main window
     window = OraclePDBToolkit()
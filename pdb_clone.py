@@ -14,15 +14,594 @@ Features:
 - Database link creation for remote cloning
 """
 
+import contextlib
+import hashlib
+import os
+import re
 import oracledb
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from utils.db_connection import create_connection
+from utils.helper_functions import format_storage_gb, parse_storage_value
 
 
-def perform_pdb_precheck(params, progress_callback=None):
+class CheckResult:
     """
-    Perform PDB clone precheck validations.
+    One precheck/postcheck validation row.
+
+    violations holds the plug-in violation rows (name, cause, type, message)
+    for the CHECK_PLUG_COMPATIBILITY result, and is None for every other check.
+    """
+    __slots__ = ('check', 'status', 'source_value', 'target_value', 'violations')
+
+    def __init__(self, check, status, source_value, target_value, violations=None):
+        self.check = check
+        self.status = status
+        self.source_value = source_value
+        self.target_value = target_value
+        self.violations = violations
+
+    def __repr__(self):
+        return f"CheckResult({self.check!r}, {self.status!r})"
+
+    def as_dict(self):
+        """Plain dict form, for JSON or other serialization at the boundary"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# DBMS_PDB.DESCRIBE calling method (1-4) that last worked, keyed on
+# (source CDB DSN, version_full); the overloads only change when Oracle is patched
+_DESCRIBE_METHOD_CACHE = {}
+
+# all_arguments rows for SYS.DBMS_PDB.DESCRIBE, keyed on version_full: the overloads
+# only change with the Oracle release, and all_arguments is a slow dictionary view
+_DESCRIBE_SIGNATURE_CACHE = {}
+
+
+def _describe_signature(cursor, version_full):
+    """
+    Return the DBMS_PDB.DESCRIBE argument rows for this Oracle version.
+
+    Each row is (argument_name, position, data_type, in_out, data_level, overload).
+    The all_arguments query runs only the first time a version is seen. An empty
+    result is not cached: all_arguments only lists what the session may execute,
+    so it reflects this user's privileges rather than the version.
+    """
+    signature = _DESCRIBE_SIGNATURE_CACHE.get(version_full)
+    if signature is None:
+        cursor.execute("""
+            SELECT argument_name, position, data_type, in_out, data_level, overload
+            FROM all_arguments
+            WHERE owner = 'SYS'
+            AND package_name = 'DBMS_PDB'
+            AND object_name = 'DESCRIBE'
+            ORDER BY overload NULLS FIRST, position
+        """)
+        signature = tuple(cursor.fetchall())
+        if version_full and signature:
+            _DESCRIBE_SIGNATURE_CACHE[version_full] = signature
+    return signature
+
+
+# DBMS_PDB.DESCRIBE calling methods (method number -> PL/SQL, label), parsed once at import;
+# the all_arguments signature decides which of them perform_pdb_precheck tries
+# Method 1: named CLOB and PDB name (Oracle 19c+ when called from the CDB)
+_PLSQL_DESCRIBE_CLOB = """
+    DECLARE
+        v_pdb_name VARCHAR2(128) := :pdb_name;
+    BEGIN
+        DBMS_PDB.DESCRIBE(
+            pdb_descr_xml => :xml_output,
+            pdb_name => v_pdb_name
+        );
+    END;
+"""
+
+# Method 3: positional CLOB and PDB name (Oracle 12c alternative)
+_PLSQL_DESCRIBE_CLOB_POSITIONAL = """
+    DECLARE
+        v_pdb_name VARCHAR2(128) := :pdb_name;
+    BEGIN
+        DBMS_PDB.DESCRIBE(:xml_output, v_pdb_name);
+    END;
+"""
+
+# Method 4: file-based (Oracle 12.1/12.2) - DESCRIBE writes to DATA_PUMP_DIR on the
+# database server, then the file is loaded back into a CLOB in one DBMS_LOB call.
+# The file name is a bind (see _describe_binds) so the block text never changes.
+_PLSQL_DESCRIBE_FILE = """
+    DECLARE
+        v_pdb_name VARCHAR2(128) := :pdb_name;
+        v_filename VARCHAR2(100) := :filename;
+        v_dir VARCHAR2(30) := 'DATA_PUMP_DIR';
+        v_bfile BFILE;
+        v_clob CLOB;
+        v_dest_offset INTEGER := 1;
+        v_src_offset INTEGER := 1;
+        v_lang_context INTEGER := DBMS_LOB.DEFAULT_LANG_CTX;
+        v_warning INTEGER;
+    BEGIN
+        -- Step 1: Generate XML file using DBMS_PDB.DESCRIBE
+        DBMS_PDB.DESCRIBE(
+            pdb_descr_file => v_filename,
+            pdb_name => v_pdb_name
+        );
+
+        -- Step 2: Load the whole file into a CLOB (database character set,
+        -- as UTL_FILE read it) instead of appending it line by line
+        DBMS_LOB.CREATETEMPORARY(v_clob, TRUE);
+        v_bfile := BFILENAME(v_dir, v_filename);
+        DBMS_LOB.OPEN(v_bfile, DBMS_LOB.LOB_READONLY);
+        DBMS_LOB.LOADCLOBFROMFILE(v_clob, v_bfile, DBMS_LOB.LOBMAXSIZE,
+                                  v_dest_offset, v_src_offset,
+                                  DBMS_LOB.DEFAULT_CSID, v_lang_context, v_warning);
+        DBMS_LOB.CLOSE(v_bfile);
+
+        -- Step 3: Delete the temporary file
+        UTL_FILE.FREMOVE(v_dir, v_filename);
+
+        -- Step 4: Return the CLOB
+        :xml_output := v_clob;
+    END;
+"""
+
+_DESCRIBE_METHODS = {
+    1: (_PLSQL_DESCRIBE_CLOB, "CLOB with PDB name from CDB (Oracle 19c+)"),
+    3: (_PLSQL_DESCRIBE_CLOB_POSITIONAL, "Positional CLOB and PDB name (Oracle 12c alt)"),
+    4: (_PLSQL_DESCRIBE_FILE, "File-based with DBMS_LOB (Oracle 12c)"),
+}
+
+
+# Characters per DBMS_PDB.DESCRIBE XML read/write round trip when copying the CLOB
+LOB_CHUNK_SIZE = 65536
+
+
+def _copy_clob(source_lob, target_conn, dump_filename=None):
+    """
+    Copy a CLOB into a temporary CLOB on another connection, LOB_CHUNK_SIZE characters at a time.
+
+    A LOB locator belongs to its connection, so the source XML cannot be bound on the
+    target directly; copying in chunks keeps the full XML out of Python memory. When
+    dump_filename is given, the same chunks are also written to that file.
+
+    Returns:
+        tuple: (target LOB, length in characters, dump error or None)
+    """
+    target_lob = target_conn.createlob(oracledb.DB_TYPE_CLOB)
+    dump_file = None
+    dump_error = None
+    if dump_filename:
+        try:
+            dump_file = open(dump_filename, 'w', encoding='utf-8')
+        except OSError as e:
+            dump_error = e
+    offset = 1
+    try:
+        while True:
+            chunk = source_lob.read(offset, LOB_CHUNK_SIZE)
+            if not chunk:
+                break
+            target_lob.write(chunk, offset)
+            if dump_file is not None:
+                try:
+                    dump_file.write(chunk)
+                except OSError as e:
+                    dump_error = e
+                    dump_file.close()
+                    dump_file = None
+            offset += len(chunk)
+    finally:
+        if dump_file is not None:
+            try:
+                dump_file.close()
+            except OSError as e:
+                dump_error = e
+    return target_lob, offset - 1, dump_error
+
+
+def _describe_binds(method_num, xml_var, pdb_name):
+    """Bind values for a _DESCRIBE_METHODS block; the file-based method also takes its file name"""
+    binds = {'xml_output': xml_var, 'pdb_name': pdb_name}
+    if method_num == 4:
+        binds['filename'] = datetime.now().strftime('pdb_describe_%Y%m%d%H%M%S.xml')
+    return binds
+
+
+_PLSQL_CHECK_COMPAT = """
+    DECLARE
+        v_compatible BOOLEAN;
+    BEGIN
+        v_compatible := DBMS_PDB.CHECK_PLUG_COMPATIBILITY(
+            pdb_descr_xml => :xml_input
+        );
+        IF v_compatible THEN
+            :result := 'TRUE';
+        ELSE
+            :result := 'FALSE';
+        END IF;
+    END;
+"""
+
+
+# One PDB's open mode, size and MAX_PDB_STORAGE, read from CDB$ROOT in one round trip;
+# CONTAINERS() reaches the PDB's database_properties without logging on to it.
+# The values come back as OUT binds (no describe/fetch); all stay NULL if the PDB is missing.
+_PDB_OVERVIEW_BLOCK = """
+    BEGIN
+        SELECT p.open_mode,
+               ROUND(SUM(d.bytes)/1024/1024/1024, 2),
+               (SELECT c.property_value
+                FROM CONTAINERS(database_properties) c
+                WHERE c.property_name = 'MAX_PDB_STORAGE'
+                AND c.con_id = p.con_id)
+          INTO :open_mode, :size_gb, :max_pdb_storage
+          FROM v$pdbs p
+          LEFT JOIN v$datafile d ON d.con_id = p.con_id
+         WHERE p.name = :pdb_name
+         GROUP BY p.con_id, p.open_mode;
+    EXCEPTION
+        WHEN NO_DATA_FOUND THEN NULL;
+    END;
+"""
+
+# Same without MAX_PDB_STORAGE, for sessions that may not use CONTAINERS()
+_PDB_MODE_SIZE_BLOCK = """
+    BEGIN
+        SELECT p.open_mode,
+               ROUND(SUM(d.bytes)/1024/1024/1024, 2)
+          INTO :open_mode, :size_gb
+          FROM v$pdbs p
+          LEFT JOIN v$datafile d ON d.con_id = p.con_id
+         WHERE p.name = :pdb_name
+         GROUP BY p.con_id, p.open_mode;
+    EXCEPTION
+        WHEN NO_DATA_FOUND THEN NULL;
+    END;
+"""
+
+
+def _pdb_overview(cursor, pdb_name):
+    """
+    Read a PDB's open mode, size in GB and raw MAX_PDB_STORAGE value.
+
+    pdb_name must already be uppercase (as stored in v$pdbs), so the lookup
+    compares the column directly instead of applying UPPER() to every row.
+
+    Returns:
+        tuple: (open_mode, size_gb, max_pdb_storage, storage_error) - the first
+               three are None when the PDB does not exist; storage_error holds
+               the exception if MAX_PDB_STORAGE could not be read
+    """
+    open_mode = cursor.var(str, 128)
+    size_gb = cursor.var(float)
+    max_pdb_storage = cursor.var(str, 256)
+    try:
+        cursor.execute(_PDB_OVERVIEW_BLOCK, open_mode=open_mode, size_gb=size_gb,
+                       max_pdb_storage=max_pdb_storage, pdb_name=pdb_name)
+        storage_error = None
+    except oracledb.DatabaseError as e:
+        # Still report mode and size; the MAX_PDB_STORAGE check is skipped instead
+        cursor.execute(_PDB_MODE_SIZE_BLOCK, open_mode=open_mode, size_gb=size_gb, pdb_name=pdb_name)
+        storage_error = e
+    if open_mode.getvalue() is None:
+        return (None, None, None, storage_error)
+    return (open_mode.getvalue(), size_gb.getvalue(), max_pdb_storage.getvalue(), storage_error)
+
+
+# Shown for a PDB whose MAX_PDB_STORAGE came back NULL while it is not open:
+# CONTAINERS() only returns rows for open PDBs, so a MOUNTED PDB's limit cannot be
+# read from CDB$ROOT. An open PDB without a STORAGE clause has no row either, which
+# means UNLIMITED.
+_PDB_STORAGE_UNKNOWN = 'unknown (PDB not open)'
+_PDB_OPEN_MODES = ('READ WRITE', 'READ ONLY')
+
+
+def _pdb_storage_limit(raw_value, open_mode):
+    """
+    Normalize a MAX_PDB_STORAGE property value.
+
+    Args:
+        raw_value: MAX_PDB_STORAGE as read by _pdb_overview (None when there is no row)
+        open_mode: The PDB's v$pdbs open mode, which decides what a NULL value means
+
+    Returns:
+        tuple: (display string, limit in GB) - the limit is None for UNLIMITED and
+               for a NULL value on a PDB that is not open (displayed as
+               _PDB_STORAGE_UNKNOWN), and the raw value is displayed as-is when it
+               cannot be parsed
+    """
+    if raw_value is None:
+        return ('UNLIMITED' if open_mode in _PDB_OPEN_MODES else _PDB_STORAGE_UNKNOWN), None
+    if raw_value.strip().upper() == 'UNLIMITED':
+        return 'UNLIMITED', None
+    gb_value = parse_storage_value(raw_value)
+    return (raw_value if gb_value is None else format_storage_gb(gb_value)), gb_value
+
+
+# Rows per fetch round trip for the row-returning views (gv$instance, dba_registry,
+# v$parameter, pdb_plug_in_violations) and the REF CURSORs that return them; large
+# enough that each is read in a single fetch
+FETCH_ARRAYSIZE = 1000
+
+# Statements cached per session (the driver default is 20): every precheck statement
+# has fixed text, so repeat prechecks on a pooled session skip the parse entirely
+STATEMENT_CACHE_SIZE = 50
+
+
+def _cursor(connection):
+    """Open a cursor sized to fetch a whole dictionary-view result in one round trip"""
+    cursor = connection.cursor()
+    cursor.arraysize = FETCH_ARRAYSIZE
+    cursor.prefetchrows = FETCH_ARRAYSIZE + 1
+    return cursor
+
+
+# Source and target queries run side by side: each side has its own connection
+# and the driver releases the GIL while it waits on the network
+_PAIR_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pdb-precheck')
+
+
+def _run_pair(func, source_args, target_args):
+    """
+    Call func(*source_args) on the worker thread and func(*target_args) on this one.
+
+    The source call is always waited for before returning or raising, so a failing
+    target call never leaves the worker using a cursor the caller is about to close.
+    A target error wins over a source error raised in the same pair.
+
+    Returns:
+        tuple: (source_result, target_result)
+    """
+    source_future = _PAIR_EXECUTOR.submit(func, *source_args)
+    try:
+        target_result = func(*target_args)
+    except BaseException:
+        wait([source_future])
+        raise
+    return source_future.result(), target_result
+
+
+# Every CDB-level fact the precheck compares, read in one round trip per side: the
+# single-value settings as OUT binds, the row lists as REF CURSOR OUT binds.
+# Scalar subqueries yield NULL (never NO_DATA_FOUND) when a view has no row.
+_SCALAR_KEYS = ('version', 'version_full', 'charset', 'tde', 'undo_mode', 'max_string_size', 'timezone')
+_CDB_LIST_KEYS = ('instances', 'registry', 'cdb_parameters')
+_CDB_FACTS_BLOCK = """
+    BEGIN
+        SELECT (SELECT version FROM v$instance),
+               (SELECT version_full FROM v$instance),
+               (SELECT value FROM nls_database_parameters WHERE parameter = 'NLS_CHARACTERSET'),
+               (SELECT wrl_type FROM v$encryption_wallet FETCH FIRST 1 ROWS ONLY),
+               (SELECT property_value FROM database_properties WHERE property_name = 'LOCAL_UNDO_ENABLED'),
+               (SELECT value FROM v$parameter WHERE name = 'max_string_size'),
+               DBTIMEZONE
+          INTO :version, :version_full, :charset, :tde, :undo_mode, :max_string_size, :timezone
+          FROM dual;
+        OPEN :instances FOR
+            SELECT inst_id, instance_name, host_name FROM gv$instance ORDER BY inst_id;
+        OPEN :registry FOR
+            SELECT comp_name, status FROM dba_registry ORDER BY comp_name;
+        OPEN :cdb_parameters FOR
+            SELECT name, value, isdefault FROM v$parameter WHERE isdefault = 'FALSE' ORDER BY name;
+    END;
+"""
+
+# The facts above a DBA may change between two prechecks (TDE, undo, parameters,
+# time zone): read on every precheck, while the rest may come from _CDB_FACTS_CACHE
+_CDB_SETTING_KEYS = ('tde', 'undo_mode', 'max_string_size', 'timezone', 'cdb_parameters')
+_CDB_SETTINGS_BLOCK = """
+    BEGIN
+        SELECT (SELECT wrl_type FROM v$encryption_wallet FETCH FIRST 1 ROWS ONLY),
+               (SELECT property_value FROM database_properties WHERE property_name = 'LOCAL_UNDO_ENABLED'),
+               (SELECT value FROM v$parameter WHERE name = 'max_string_size'),
+               DBTIMEZONE
+          INTO :tde, :undo_mode, :max_string_size, :timezone
+          FROM dual;
+        OPEN :cdb_parameters FOR
+            SELECT name, value, isdefault FROM v$parameter WHERE isdefault = 'FALSE' ORDER BY name;
+    END;
+"""
+
+# Postcheck details for one side and PDB, in one round trip
+# (con_id is looked up once, so v$datafile is filtered on a plain value, not a subquery)
+_POSTCHECK_BLOCK = """
+    DECLARE
+        v_con_id NUMBER;
+    BEGIN
+        SELECT MAX(con_id) INTO v_con_id FROM v$pdbs WHERE name = :pdb_name;
+        OPEN :instances FOR
+            SELECT inst_id, instance_name, host_name FROM gv$instance ORDER BY inst_id;
+        SELECT ROUND(SUM(bytes)/1024/1024/1024, 2)
+          INTO :size_gb
+          FROM v$datafile
+         WHERE con_id = v_con_id;
+        OPEN :services FOR
+            SELECT name, pdb FROM cdb_services WHERE pdb = :pdb_name ORDER BY name;
+    END;
+"""
+
+
+def _ref_cursor(cursor):
+    """
+    Cursor to bind as a REF CURSOR OUT variable on cursor's connection.
+
+    Prefetch only applies to a REF CURSOR if it is set before the block runs,
+    which a cursor.var(DB_TYPE_CURSOR) result does not allow.
+    """
+    return _cursor(cursor.connection)
+
+
+def _fetch_ref_cursor(ref_cursor):
+    """Fetch every row of a bound REF CURSOR, then close it"""
+    with ref_cursor:
+        return ref_cursor.fetchall()
+
+
+def _read_cdb_facts(cursor, block=_CDB_FACTS_BLOCK, keys=_SCALAR_KEYS + _CDB_LIST_KEYS):
+    """Run a CDB facts block and return its scalar values and _CDB_LIST_KEYS rows as one dict"""
+    scalar_vars = {key: cursor.var(str, 256) for key in keys if key not in _CDB_LIST_KEYS}
+    list_vars = {key: _ref_cursor(cursor) for key in keys if key in _CDB_LIST_KEYS}
+    cursor.execute(block, {**scalar_vars, **list_vars})
+    facts = {key: var.getvalue() for key, var in scalar_vars.items()}
+    facts.update((key, _fetch_ref_cursor(var)) for key, var in list_vars.items())
+    return facts
+
+
+def _read_postcheck_side(cursor, pdb_name):
+    """Run _POSTCHECK_BLOCK for one side and return (instances, pdb_size_gb, services)"""
+    instances = _ref_cursor(cursor)
+    size_gb = cursor.var(float)
+    services = _ref_cursor(cursor)
+    cursor.execute(_POSTCHECK_BLOCK, instances=instances, size_gb=size_gb, services=services,
+                   pdb_name=pdb_name)
+    return _fetch_ref_cursor(instances), size_gb.getvalue() or 0, _fetch_ref_cursor(services)
+
+
+# No /*+ RESULT_CACHE */ on the v$parameter reads: Oracle never result-caches queries on
+# dynamic performance views, even under RESULT_CACHE_MODE=FORCE. Repeat reads are served
+# by the session statement cache (STATEMENT_CACHE_SIZE) and _CDB_FACTS_CACHE instead.
+_ALL_PARAMETERS_SQL = """
+    SELECT name, value, isdefault
+    FROM v$parameter
+    ORDER BY name
+"""
+
+# PDB names are spliced into ALTER SESSION SET CONTAINER as identifiers
+_PDB_NAME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9_$#]*$')
+
+
+def _container_query(cursor, pdb_name, sql):
+    """
+    Run a query inside a PDB over an existing CDB session by switching its container.
+
+    Saves a separate logon to the PDB service. The session is always switched back
+    to CDB$ROOT afterwards, since CDB sessions are reused. Needs the SET CONTAINER
+    privilege (held by common admin users).
+    """
+    if not _PDB_NAME_RE.match(pdb_name or ''):
+        raise ValueError(f"Invalid PDB name: {pdb_name!r}")
+    cursor.execute(f"ALTER SESSION SET CONTAINER = {pdb_name}")
+    try:
+        cursor.execute(sql)
+        return cursor.fetchall()
+    finally:
+        cursor.execute("ALTER SESSION SET CONTAINER = CDB$ROOT")
+
+
+def _fetch_params(cursor, pdb_name):
+    """
+    Read a PDB's v$parameter once and derive both views the checks need.
+
+    Returns ({name: value} for every parameter, [(name, value, isdefault)] for the
+    non-default ones), so the non-default subset is filtered here rather than by a
+    second pass over v$parameter.
+    """
+    rows = _container_query(cursor, pdb_name, _ALL_PARAMETERS_SQL)
+    return {row[0]: row[1] for row in rows}, [row for row in rows if row[2] == 'FALSE']
+
+
+def _non_default_params(cursor, pdb_name):
+    """
+    Non-default parameter rows of a PDB for the precheck, as (rows, error).
+
+    A failed read yields ([], the exception) instead of raising, so one side's
+    error does not discard the other side's rows.
+    """
+    try:
+        return _fetch_params(cursor, pdb_name)[1], None
+    except Exception as e:
+        return [], e
+
+
+# Static CDB-level facts (all but _CDB_SETTING_KEYS) per (source DSN, target DSN, mode,
+# source user, target user): (expiry on time.monotonic(), (source facts, target facts)).
+# They do not depend on the PDB, so a run of prechecks between the same two CDBs
+# (one per PDB in a migration) reads them once per _CDB_FACTS_TTL seconds.
+_CDB_FACTS_TTL = 300
+_CDB_FACTS_CACHE = {}
+_CDB_FACTS_LOCK = threading.Lock()
+
+
+def _cdb_facts(source_cursor, target_cursor, key):
+    """
+    Return the CDB-level facts for a source/target CDB pair.
+
+    The static facts come from cache while fresh; the _CDB_SETTING_KEYS settings
+    are read on every call, so a fix made between two prechecks shows up.
+
+    Returns:
+        dict: 'instances', 'scalars', 'registry' and 'cdb_parameters', each a
+              (source, target) tuple
+    """
+    with _CDB_FACTS_LOCK:
+        cached = _CDB_FACTS_CACHE.get(key)
+
+    if cached is not None and cached[0] > time.monotonic():
+        source_facts, target_facts = _run_pair(
+            _read_cdb_facts,
+            (source_cursor, _CDB_SETTINGS_BLOCK, _CDB_SETTING_KEYS),
+            (target_cursor, _CDB_SETTINGS_BLOCK, _CDB_SETTING_KEYS))
+        source_facts.update(cached[1][0])
+        target_facts.update(cached[1][1])
+    else:
+        source_facts, target_facts = _run_pair(_read_cdb_facts, (source_cursor,), (target_cursor,))
+        static = tuple({name: value for name, value in side.items() if name not in _CDB_SETTING_KEYS}
+                       for side in (source_facts, target_facts))
+        with _CDB_FACTS_LOCK:
+            _CDB_FACTS_CACHE[key] = (time.monotonic() + _CDB_FACTS_TTL, static)
+
+    facts = {name: (source_facts[name], target_facts[name]) for name in _CDB_LIST_KEYS}
+    facts['scalars'] = (source_facts, target_facts)
+    return facts
+
+
+# Session pools for precheck, clone and postcheck, keyed on (dsn, user, mode, password
+# digest): every run against the same CDB borrows a pooled session instead of a full logon
+_pool_cache = {}
+_pool_lock = threading.Lock()
+
+
+def _get_conn(dsn, mode, user=None, pwd=None):
+    """Acquire a pooled connection for this endpoint; close() returns it to the pool"""
+    # A changed password gets its own pool rather than one logging on with the old one
+    key = (dsn, user, mode, hashlib.sha256((pwd or '').encode('utf-8')).hexdigest())
+    with _pool_lock:
+        pool = _pool_cache.get(key)
+        if pool is None:
+            if mode == 'external_auth':
+                pool = oracledb.create_pool(dsn=dsn, externalauth=True, homogeneous=False,
+                                            min=1, max=4, increment=1,
+                                            getmode=oracledb.POOL_GETMODE_WAIT,
+                                            stmtcachesize=STATEMENT_CACHE_SIZE)
+            else:
+                pool = oracledb.create_pool(user=user, password=pwd, dsn=dsn,
+                                            min=1, max=4, increment=1,
+                                            getmode=oracledb.POOL_GETMODE_WAIT,
+                                            stmtcachesize=STATEMENT_CACHE_SIZE)
+            _pool_cache[key] = pool
+    try:
+        return pool.acquire()
+    except oracledb.DatabaseError as e:
+        error_obj, = e.args
+        if error_obj.code == 1017:
+            # Invalid credentials: do not keep a pool that can never log on
+            with _pool_lock:
+                if _pool_cache.get(key) is pool:
+                    del _pool_cache[key]
+            pool.close(force=True)
+        raise
+
+
+def iter_pdb_precheck(params, source_data, target_data, progress_callback=None):
+    """
+    Run the PDB clone precheck validations, yielding each CheckResult as it is produced.
+
+    source_data and target_data are caller-supplied dicts filled with the gathered
+    details as the checks run. Closing the generator early (e.g. after a fatal
+    FAILED check) skips the remaining SQL and releases the sessions.
 
     Args:
         params (dict): Parameters for precheck including:
@@ -30,14 +609,25 @@ def perform_pdb_precheck(params, progress_callback=None):
             - source_scan, source_port, source_cdb, source_pdb
             - target_scan, target_port, target_cdb, target_pdb
             - For user_pass: source_username, source_password, target_username, target_password
+        source_data (dict): Filled with source CDB/PDB details
+        target_data (dict): Filled with target CDB/PDB details
         progress_callback (callable, optional): Function to call with progress messages
 
-    Returns:
-        tuple: (validation_results, source_data, target_data)
+    Yields:
+        CheckResult: one per validation check
     """
     def emit_progress(message):
+        # message may be a zero-argument callable, formatted only when someone is listening
         if progress_callback:
-            progress_callback(message)
+            progress_callback(message() if callable(message) else message)
+
+    # DEBUG output (and the diagnostic query behind it) only when asked for
+    debug = bool(params.get('debug')) or os.environ.get('PDB_TOOLKIT_DEBUG') == '1'
+
+    def emit_debug(message):
+        # message may be a zero-argument callable, so non-debug runs skip the formatting
+        if debug and progress_callback:
+            progress_callback(f"DEBUG: {message() if callable(message) else message}")
 
     connection_mode = params.get('connection_mode', 'external_auth')
     source_scan = params.get('source_scan')
@@ -49,820 +639,546 @@ def perform_pdb_precheck(params, progress_callback=None):
     target_cdb = params.get('target_cdb')
     target_pdb = params.get('target_pdb')
 
+    # v$pdbs stores names in uppercase: fold the binds once here, not per row in SQL
+    source_pdb_u = (source_pdb or '').upper()
+    target_pdb_u = (target_pdb or '').upper()
+
     emit_progress("Starting PDB clone precheck...")
 
     # Build connection strings
     source_cdb_dsn = f"{source_scan}:{source_port}/{source_cdb}"
     target_cdb_dsn = f"{target_scan}:{target_port}/{target_cdb}"
 
-    # Connect to both CDBs
-    if connection_mode == 'external_auth':
-        emit_progress(f"Connecting to Source CDB: {source_cdb_dsn} (External Auth)")
-        source_conn = oracledb.connect(dsn=source_cdb_dsn, externalauth=True)
-
-        emit_progress(f"Connecting to Target CDB: {target_cdb_dsn} (External Auth)")
-        target_conn = oracledb.connect(dsn=target_cdb_dsn, externalauth=True)
-    else:
-        source_user = params.get('source_username')
-        source_pass = params.get('source_password')
-        target_user = params.get('target_username')
-        target_pass = params.get('target_password')
-
-        emit_progress(f"Connecting to Source CDB: {source_cdb_dsn} (User: {source_user})")
-        source_conn = oracledb.connect(user=source_user, password=source_pass, dsn=source_cdb_dsn)
-
-        emit_progress(f"Connecting to Target CDB: {target_cdb_dsn} (User: {target_user})")
-        target_conn = oracledb.connect(user=target_user, password=target_pass, dsn=target_cdb_dsn)
-
-    validation_results = []
-    source_data = {}
-    target_data = {}
-
-    # Gather instance and host information
-    emit_progress("Gathering instance and host information...")
-    source_cursor = source_conn.cursor()
-    target_cursor = target_conn.cursor()
-
-    # Source instance information
-    source_cursor.execute("""
-        SELECT inst_id, instance_name, host_name
-        FROM gv$instance
-        ORDER BY inst_id
-    """)
-    source_data['instances'] = source_cursor.fetchall()
-
-    # Target instance information
-    target_cursor.execute("""
-        SELECT inst_id, instance_name, host_name
-        FROM gv$instance
-        ORDER BY inst_id
-    """)
-    target_data['instances'] = target_cursor.fetchall()
-
-    # Gather PDB size information
-    emit_progress("Gathering PDB size information...")
-
-    # Source PDB size
-    source_cursor.execute("""
-        SELECT ROUND(SUM(bytes)/1024/1024/1024, 2) as size_gb
-        FROM v$datafile
-        WHERE con_id = (SELECT con_id FROM v$pdbs WHERE UPPER(name) = UPPER(:pdb_name))
-    """, pdb_name=source_pdb)
-    source_size_result = source_cursor.fetchone()
-    source_data['pdb_size_gb'] = source_size_result[0] if source_size_result and source_size_result[0] else 0
-
-    # Target PDB size (if it exists)
-    target_cursor.execute("""
-        SELECT ROUND(SUM(bytes)/1024/1024/1024, 2) as size_gb
-        FROM v$datafile
-        WHERE con_id = (SELECT con_id FROM v$pdbs WHERE UPPER(name) = UPPER(:pdb_name))
-    """, pdb_name=target_pdb)
-    target_size_result = target_cursor.fetchone()
-    target_data['pdb_size_gb'] = target_size_result[0] if target_size_result and target_size_result[0] else 0
-
-    # Check 1: Database version and patch level
-    emit_progress("Checking database versions...")
-
-    source_cursor.execute("SELECT version, version_full FROM v$instance")
-    source_version = source_cursor.fetchone()
-    source_data['version'] = source_version[0]
-    source_data['version_full'] = source_version[1]
-
-    target_cursor.execute("SELECT version, version_full FROM v$instance")
-    target_version = target_cursor.fetchone()
-    target_data['version'] = target_version[0]
-    target_data['version_full'] = target_version[1]
-
-    version_match = source_version[1] == target_version[1]
-    validation_results.append({
-        'check': 'Database Version and Patch Level',
-        'status': 'PASS' if version_match else 'FAILED',
-        'source_value': source_version[1],
-        'target_value': target_version[1]
-    })
-
-    # Check 2: Character set
-    emit_progress("Checking character sets...")
-    source_cursor.execute("SELECT value FROM nls_database_parameters WHERE parameter = 'NLS_CHARACTERSET'")
-    source_charset = source_cursor.fetchone()[0]
-    source_data['charset'] = source_charset
-
-    target_cursor.execute("SELECT value FROM nls_database_parameters WHERE parameter = 'NLS_CHARACTERSET'")
-    target_charset = target_cursor.fetchone()[0]
-    target_data['charset'] = target_charset
-
-    charset_ok = source_charset == target_charset
-    validation_results.append({
-        'check': 'Character Set Compatibility',
-        'status': 'PASS' if charset_ok else 'FAILED',
-        'source_value': source_charset,
-        'target_value': target_charset
-    })
-
-    # Check 3: DB Registry components
-    emit_progress("Checking DB registry components...")
-    source_cursor.execute("SELECT comp_name, status FROM dba_registry ORDER BY comp_name")
-    source_registry = source_cursor.fetchall()
-    source_data['registry'] = source_registry
-
-    target_cursor.execute("SELECT comp_name, status FROM dba_registry ORDER BY comp_name")
-    target_registry = target_cursor.fetchall()
-    target_data['registry'] = target_registry
-
-    source_comps = set([r[0] for r in source_registry])
-    target_comps = set([r[0] for r in target_registry])
-    registry_ok = source_comps.issubset(target_comps)
-
-    validation_results.append({
-        'check': 'DB Registry Components',
-        'status': 'PASS' if registry_ok else 'FAILED',
-        'source_value': f"{len(source_comps)} components",
-        'target_value': f"{len(target_comps)} components"
-    })
-
-    # Check 4: Source PDB status
-    emit_progress("Checking source PDB status...")
-    source_cursor.execute("""
-        SELECT open_mode
-        FROM v$pdbs
-        WHERE UPPER(name) = UPPER(:pdb_name)
-    """, pdb_name=source_pdb)
-    result = source_cursor.fetchone()
-    if result:
-        source_pdb_mode = result[0]
-        source_data['pdb_mode'] = source_pdb_mode
-        pdb_open = source_pdb_mode != 'MOUNTED'
-        validation_results.append({
-            'check': 'Source PDB Open Status',
-            'status': 'PASS' if pdb_open else 'FAILED',
-            'source_value': source_pdb_mode,
-            'target_value': 'N/A'
-        })
-    else:
-        validation_results.append({
-            'check': 'Source PDB Open Status',
-            'status': 'FAILED',
-            'source_value': 'PDB not found',
-            'target_value': 'N/A'
-        })
-
-    # Check 4b: Target PDB existence check
-    emit_progress("Checking target PDB status...")
-    target_cursor.execute("""
-        SELECT open_mode
-        FROM v$pdbs
-        WHERE UPPER(name) = UPPER(:pdb_name)
-    """, pdb_name=target_pdb)
-    target_result = target_cursor.fetchone()
-    if target_result:
-        target_pdb_mode = target_result[0]
-        target_data['pdb_mode'] = target_pdb_mode
-        validation_results.append({
-            'check': 'Target PDB Does Exist',
-            'status': 'PASS',
-            'source_value': 'N/A',
-            'target_value': f'PDB already exists ({target_pdb_mode})'
-        })
-    else:
-        target_data['pdb_mode'] = 'Does not exist'
-        validation_results.append({
-            'check': 'Target PDB Does Exist',
-            'status': 'PASS',
-            'source_value': 'N/A',
-            'target_value': 'PDB does not exist (ready for clone)'
-        })
-
-    # Check 5: TDE configuration
-    emit_progress("Checking TDE configuration...")
-    source_cursor.execute("SELECT wrl_type FROM v$encryption_wallet")
-    source_tde = source_cursor.fetchone()
-    source_tde_type = source_tde[0] if source_tde else 'NONE'
-    source_data['tde'] = source_tde_type
-
-    target_cursor.execute("SELECT wrl_type FROM v$encryption_wallet")
-    target_tde = target_cursor.fetchone()
-    target_tde_type = target_tde[0] if target_tde else 'NONE'
-    target_data['tde'] = target_tde_type
-
-    tde_match = source_tde_type == target_tde_type
-    validation_results.append({
-        'check': 'TDE Configuration Method',
-        'status': 'PASS' if tde_match else 'FAILED',
-        'source_value': source_tde_type,
-        'target_value': target_tde_type
-    })
-
-    # Check 6: Local undo mode
-    emit_progress("Checking undo mode...")
-    source_cursor.execute("SELECT property_value FROM database_properties WHERE property_name = 'LOCAL_UNDO_ENABLED'")
-    source_undo = source_cursor.fetchone()
-    source_undo_mode = source_undo[0] if source_undo else 'FALSE'
-    source_data['undo_mode'] = source_undo_mode
-
-    target_cursor.execute("SELECT property_value FROM database_properties WHERE property_name = 'LOCAL_UNDO_ENABLED'")
-    target_undo = target_cursor.fetchone()
-    target_undo_mode = target_undo[0] if target_undo else 'FALSE'
-    target_data['undo_mode'] = target_undo_mode
-
-    undo_ok = source_undo_mode == 'TRUE' and target_undo_mode == 'TRUE'
-    validation_results.append({
-        'check': 'Local Undo Mode',
-        'status': 'PASS' if undo_ok else 'FAILED',
-        'source_value': source_undo_mode,
-        'target_value': target_undo_mode
-    })
-
-    # Check 7: MAX_STRING_SIZE compatibility
-    emit_progress("Checking MAX_STRING_SIZE compatibility...")
-    source_cursor.execute("SELECT value FROM v$parameter WHERE name = 'max_string_size'")
-    source_max_string = source_cursor.fetchone()
-    source_max_string_size = source_max_string[0] if source_max_string else 'STANDARD'
-    source_data['max_string_size'] = source_max_string_size
-
-    target_cursor.execute("SELECT value FROM v$parameter WHERE name = 'max_string_size'")
-    target_max_string = target_cursor.fetchone()
-    target_max_string_size = target_max_string[0] if target_max_string else 'STANDARD'
-    target_data['max_string_size'] = target_max_string_size
-
-    max_string_ok = source_max_string_size == target_max_string_size
-    validation_results.append({
-        'check': 'MAX_STRING_SIZE Compatibility',
-        'status': 'PASS' if max_string_ok else 'FAILED',
-        'source_value': source_max_string_size,
-        'target_value': target_max_string_size
-    })
-
-    # Check 8: Timezone setting compatibility
-    emit_progress("Checking timezone settings...")
-    source_cursor.execute("SELECT DBTIMEZONE FROM dual")
-    source_tz = source_cursor.fetchone()
-    source_timezone = source_tz[0] if source_tz else 'Unknown'
-    source_data['timezone'] = source_timezone
-
-    target_cursor.execute("SELECT DBTIMEZONE FROM dual")
-    target_tz = target_cursor.fetchone()
-    target_timezone = target_tz[0] if target_tz else 'Unknown'
-    target_data['timezone'] = target_timezone
-
-    timezone_ok = source_timezone == target_timezone
-    validation_results.append({
-        'check': 'Timezone Setting Compatibility',
-        'status': 'PASS' if timezone_ok else 'FAILED',
-        'source_value': source_timezone,
-        'target_value': target_timezone
-    })
-
-    # Check 9: MAX_PDB_STORAGE limit check
-    emit_progress("Checking MAX_PDB_STORAGE limit...")
-
-    # MAX_PDB_STORAGE is a PDB-level property in database_properties
-    # Need to query from source PDB (not CDB) and compare with target PDB
-    try:
-        # Connect to source PDB to get its MAX_PDB_STORAGE
-        source_pdb_dsn_temp = f"{source_scan}:{source_port}/{source_pdb}"
+    with contextlib.ExitStack() as stack:
+        # Connect to both CDBs
         if connection_mode == 'external_auth':
-            source_pdb_conn_temp = oracledb.connect(dsn=source_pdb_dsn_temp, externalauth=True)
+            emit_progress(f"Connecting to Source CDB: {source_cdb_dsn} (External Auth)")
+            source_conn = stack.enter_context(_get_conn(source_cdb_dsn, connection_mode))
+
+            emit_progress(f"Connecting to Target CDB: {target_cdb_dsn} (External Auth)")
+            target_conn = stack.enter_context(_get_conn(target_cdb_dsn, connection_mode))
         else:
             source_user = params.get('source_username')
             source_pass = params.get('source_password')
-            source_pdb_conn_temp = oracledb.connect(user=source_user, password=source_pass, dsn=source_pdb_dsn_temp)
-
-        source_pdb_cursor_temp = source_pdb_conn_temp.cursor()
-        source_pdb_cursor_temp.execute("""
-            SELECT property_value
-            FROM database_properties
-            WHERE property_name = 'MAX_PDB_STORAGE'
-        """)
-        source_max_pdb_result = source_pdb_cursor_temp.fetchone()
-        source_max_pdb_storage_raw = source_max_pdb_result[0] if source_max_pdb_result and source_max_pdb_result[0] else 'UNLIMITED'
-
-        # Convert source MAX_PDB_STORAGE to GB for display
-        if source_max_pdb_storage_raw.upper() == 'UNLIMITED':
-            source_max_pdb_storage = 'UNLIMITED'
+            target_user = params.get('target_username')
+            target_pass = params.get('target_password')
+
+            emit_progress(f"Connecting to Source CDB: {source_cdb_dsn} (User: {source_user})")
+            source_conn = stack.enter_context(_get_conn(source_cdb_dsn, connection_mode, source_user, source_pass))
+
+            emit_progress(f"Connecting to Target CDB: {target_cdb_dsn} (User: {target_user})")
+            target_conn = stack.enter_context(_get_conn(target_cdb_dsn, connection_mode, target_user, target_pass))
+
+        source_cursor = stack.enter_context(_cursor(source_conn))
+        target_cursor = stack.enter_context(_cursor(target_conn))
+
+        # Gather instance and host information
+        # (with every other CDB-level fact, shared by prechecks between the same two CDBs)
+        emit_progress("Gathering instance and host information...")
+        cdb_facts = _cdb_facts(source_cursor, target_cursor,
+                               (source_cdb_dsn, target_cdb_dsn, connection_mode,
+                                params.get('source_username'), params.get('target_username')))
+        source_data['instances'], target_data['instances'] = cdb_facts['instances']
+
+        # Gather PDB size information (target PDB may not exist yet), source and target concurrently
+        # (open mode and MAX_PDB_STORAGE come back in the same round trip, for Checks 4 and 9)
+        emit_progress("Gathering PDB size information...")
+        source_overview, target_overview = _run_pair(_pdb_overview, (source_cursor, source_pdb_u),
+                                                     (target_cursor, target_pdb_u))
+        source_pdb_mode, source_size_gb, source_max_pdb_storage_raw, source_storage_error = source_overview
+        target_pdb_mode, target_size_gb, target_max_pdb_storage_raw, target_storage_error = target_overview
+        source_data['pdb_size_gb'] = source_size_gb or 0
+        target_data['pdb_size_gb'] = target_size_gb or 0
+
+        # Check 1: Database version and patch level
+        emit_progress("Checking database versions...")
+
+        # The CDB facts block returned the scalars for Checks 1, 2 and 5-8
+        source_scalars, target_scalars = cdb_facts['scalars']
+
+        source_data['version'] = source_scalars['version']
+        source_data['version_full'] = source_scalars['version_full']
+        target_data['version'] = target_scalars['version']
+        target_data['version_full'] = target_scalars['version_full']
+
+        version_match = source_scalars['version_full'] == target_scalars['version_full']
+        yield CheckResult(
+            check='Database Version and Patch Level',
+            status='PASS' if version_match else 'FAILED',
+            source_value=source_scalars['version_full'],
+            target_value=target_scalars['version_full']
+        )
+
+        # Check 2: Character set
+        emit_progress("Checking character sets...")
+        source_charset = source_scalars['charset']
+        target_charset = target_scalars['charset']
+        source_data['charset'] = source_charset
+        target_data['charset'] = target_charset
+
+        charset_ok = source_charset == target_charset
+        yield CheckResult(
+            check='Character Set Compatibility',
+            status='PASS' if charset_ok else 'FAILED',
+            source_value=source_charset,
+            target_value=target_charset
+        )
+
+        # Check 3: DB Registry components
+        emit_progress("Checking DB registry components...")
+        source_registry, target_registry = cdb_facts['registry']
+        source_data['registry'] = source_registry
+        target_data['registry'] = target_registry
+
+        source_comps = {r[0] for r in source_registry}
+        target_comps = {r[0] for r in target_registry}
+        registry_ok = source_comps.issubset(target_comps)
+
+        yield CheckResult(
+            check='DB Registry Components',
+            status='PASS' if registry_ok else 'FAILED',
+            source_value=f"{len(source_comps)} components",
+            target_value=f"{len(target_comps)} components"
+        )
+
+        # Check 4: Source PDB status
+        emit_progress("Checking source PDB status...")
+        if source_pdb_mode:
+            source_data['pdb_mode'] = source_pdb_mode
+            pdb_open = source_pdb_mode != 'MOUNTED'
+            yield CheckResult(
+                check='Source PDB Open Status',
+                status='PASS' if pdb_open else 'FAILED',
+                source_value=source_pdb_mode,
+                target_value='N/A'
+            )
         else:
-            try:
-                storage_str = source_max_pdb_storage_raw.upper()
-                if 'G' in storage_str:
-                    source_max_pdb_storage = source_max_pdb_storage_raw  # Already in GB
-                elif 'M' in storage_str:
-                    gb_val = float(storage_str.replace('M', '')) / 1024
-                    source_max_pdb_storage = f"{gb_val:.2f}G"
-                elif 'T' in storage_str:
-                    gb_val = float(storage_str.replace('T', '')) * 1024
-                    source_max_pdb_storage = f"{gb_val:.2f}G"
-                else:
-                    # Assume bytes
-                    gb_val = float(storage_str) / (1024**3)
-                    source_max_pdb_storage = f"{gb_val:.2f}G"
-            except (ValueError, AttributeError):
-                source_max_pdb_storage = source_max_pdb_storage_raw  # Keep original if parsing fails
-
-        source_pdb_cursor_temp.close()
-        source_pdb_conn_temp.close()
-
-        # Connect to target PDB to get its MAX_PDB_STORAGE (if target PDB exists)
-        target_pdb_exists = target_data.get('pdb_mode') and target_data['pdb_mode'] != 'Does not exist'
-
-        if target_pdb_exists:
-            target_pdb_dsn_temp = f"{target_scan}:{target_port}/{target_pdb}"
-            if connection_mode == 'external_auth':
-                target_pdb_conn_temp = oracledb.connect(dsn=target_pdb_dsn_temp, externalauth=True)
+            yield CheckResult(
+                check='Source PDB Open Status',
+                status='FAILED',
+                source_value='PDB not found',
+                target_value='N/A'
+            )
+
+        # Check 4b: Target PDB existence check
+        emit_progress("Checking target PDB status...")
+        if target_pdb_mode:
+            target_data['pdb_mode'] = target_pdb_mode
+            yield CheckResult(
+                check='Target PDB Does Exist',
+                status='PASS',
+                source_value='N/A',
+                target_value=f'PDB already exists ({target_pdb_mode})'
+            )
+        else:
+            target_data['pdb_mode'] = 'Does not exist'
+            yield CheckResult(
+                check='Target PDB Does Exist',
+                status='PASS',
+                source_value='N/A',
+                target_value='PDB does not exist (ready for clone)'
+            )
+
+        # Check 5: TDE configuration
+        emit_progress("Checking TDE configuration...")
+        source_tde_type = source_scalars['tde'] or 'NONE'
+        source_data['tde'] = source_tde_type
+
+        target_tde_type = target_scalars['tde'] or 'NONE'
+        target_data['tde'] = target_tde_type
+
+        tde_match = source_tde_type == target_tde_type
+        yield CheckResult(
+            check='TDE Configuration Method',
+            status='PASS' if tde_match else 'FAILED',
+            source_value=source_tde_type,
+            target_value=target_tde_type
+        )
+
+        # Check 6: Local undo mode
+        emit_progress("Checking undo mode...")
+        source_undo_mode = source_scalars['undo_mode'] or 'FALSE'
+        source_data['undo_mode'] = source_undo_mode
+
+        target_undo_mode = target_scalars['undo_mode'] or 'FALSE'
+        target_data['undo_mode'] = target_undo_mode
+
+        undo_ok = source_undo_mode == 'TRUE' and target_undo_mode == 'TRUE'
+        yield CheckResult(
+            check='Local Undo Mode',
+            status='PASS' if undo_ok else 'FAILED',
+            source_value=source_undo_mode,
+            target_value=target_undo_mode
+        )
+
+        # Check 7: MAX_STRING_SIZE compatibility
+        emit_progress("Checking MAX_STRING_SIZE compatibility...")
+        source_max_string_size = source_scalars['max_string_size'] or 'STANDARD'
+        source_data['max_string_size'] = source_max_string_size
+
+        target_max_string_size = target_scalars['max_string_size'] or 'STANDARD'
+        target_data['max_string_size'] = target_max_string_size
+
+        max_string_ok = source_max_string_size == target_max_string_size
+        yield CheckResult(
+            check='MAX_STRING_SIZE Compatibility',
+            status='PASS' if max_string_ok else 'FAILED',
+            source_value=source_max_string_size,
+            target_value=target_max_string_size
+        )
+
+        # Check 8: Timezone setting compatibility
+        emit_progress("Checking timezone settings...")
+        source_timezone = source_scalars['timezone'] or 'Unknown'
+        source_data['timezone'] = source_timezone
+
+        target_timezone = target_scalars['timezone'] or 'Unknown'
+        target_data['timezone'] = target_timezone
+
+        timezone_ok = source_timezone == target_timezone
+        yield CheckResult(
+            check='Timezone Setting Compatibility',
+            status='PASS' if timezone_ok else 'FAILED',
+            source_value=source_timezone,
+            target_value=target_timezone
+        )
+
+        # Check 9: MAX_PDB_STORAGE limit check
+        emit_progress("Checking MAX_PDB_STORAGE limit...")
+
+        # MAX_PDB_STORAGE is a PDB-level property in database_properties
+        # Need to read it for the source PDB (not CDB) and compare with target PDB
+        try:
+            # Read with the PDB sizes above, through CONTAINERS() on the CDB sessions
+            target_pdb_exists = target_data.get('pdb_mode') and target_data['pdb_mode'] != 'Does not exist'
+            if source_storage_error is not None:
+                raise source_storage_error
+            source_max_pdb_storage, _ = _pdb_storage_limit(source_max_pdb_storage_raw, source_pdb_mode)
+
+            # Target PDB's MAX_PDB_STORAGE (if target PDB exists), as a display string and GB for comparison
+            if target_pdb_exists:
+                if target_storage_error is not None:
+                    raise target_storage_error
+                target_max_pdb_storage, max_storage_gb = _pdb_storage_limit(target_max_pdb_storage_raw, target_pdb_mode)
             else:
-                target_user = params.get('target_username')
-                target_pass = params.get('target_password')
-                target_pdb_conn_temp = oracledb.connect(user=target_user, password=target_pass, dsn=target_pdb_dsn_temp)
-
-            target_pdb_cursor_temp = target_pdb_conn_temp.cursor()
-            target_pdb_cursor_temp.execute("""
-                SELECT property_value
-                FROM database_properties
-                WHERE property_name = 'MAX_PDB_STORAGE'
-            """)
-            target_max_pdb_result = target_pdb_cursor_temp.fetchone()
-            target_max_pdb_storage_raw = target_max_pdb_result[0] if target_max_pdb_result and target_max_pdb_result[0] else 'UNLIMITED'
-
-            # Convert target MAX_PDB_STORAGE to GB for display and comparison
-            if target_max_pdb_storage_raw.upper() == 'UNLIMITED':
-                target_max_pdb_storage = 'UNLIMITED'
+                target_max_pdb_storage = 'N/A (PDB not created yet)'
                 max_storage_gb = None
+
+            target_data['max_pdb_storage'] = target_max_pdb_storage
+
+            # Compare with source PDB size
+            if target_max_pdb_storage == _PDB_STORAGE_UNKNOWN:
+                storage_ok = None
+                storage_status = target_max_pdb_storage
+            elif target_max_pdb_storage == 'N/A (PDB not created yet)':
+                storage_ok = True
+                storage_status = target_max_pdb_storage
+            elif target_max_pdb_storage == 'UNLIMITED':
+                storage_ok = True
+                storage_status = f"UNLIMITED (sufficient for {source_data['pdb_size_gb']} GB source PDB)"
+            elif max_storage_gb is not None:
+                storage_ok = max_storage_gb >= source_data['pdb_size_gb']
+                storage_status = f"{target_max_pdb_storage} ({'sufficient' if storage_ok else 'insufficient'} for {source_data['pdb_size_gb']} GB source PDB)"
             else:
-                try:
-                    storage_str = target_max_pdb_storage_raw.upper()
-                    if 'G' in storage_str:
-                        max_storage_gb = float(storage_str.replace('G', ''))
-                        target_max_pdb_storage = f"{max_storage_gb:.2f}G"
-                    elif 'M' in storage_str:
-                        max_storage_gb = float(storage_str.replace('M', '')) / 1024
-                        target_max_pdb_storage = f"{max_storage_gb:.2f}G"
-                    elif 'T' in storage_str:
-                        max_storage_gb = float(storage_str.replace('T', '')) * 1024
-                        target_max_pdb_storage = f"{max_storage_gb:.2f}G"
-                    else:
-                        # Assume bytes
-                        max_storage_gb = float(storage_str) / (1024**3)
-                        target_max_pdb_storage = f"{max_storage_gb:.2f}G"
-                except (ValueError, AttributeError):
-                    target_max_pdb_storage = target_max_pdb_storage_raw  # Keep original if parsing fails
-                    max_storage_gb = None
-
-            target_pdb_cursor_temp.close()
-            target_pdb_conn_temp.close()
-        else:
-            target_max_pdb_storage = 'N/A (PDB not created yet)'
-            max_storage_gb = None
-
-        target_data['max_pdb_storage'] = target_max_pdb_storage
-
-        # Compare with source PDB size
-        if target_max_pdb_storage == 'N/A (PDB not created yet)':
-            storage_ok = True
-            storage_status = target_max_pdb_storage
-        elif target_max_pdb_storage == 'UNLIMITED':
-            storage_ok = True
-            storage_status = f"UNLIMITED (sufficient for {source_data['pdb_size_gb']} GB source PDB)"
-        elif max_storage_gb is not None:
-            storage_ok = max_storage_gb >= source_data['pdb_size_gb']
-            storage_status = f"{target_max_pdb_storage} ({'sufficient' if storage_ok else 'insufficient'} for {source_data['pdb_size_gb']} GB source PDB)"
-        else:
-            # Parsing failed
-            storage_ok = True
-            storage_status = f"{target_max_pdb_storage} (unable to parse, treating as sufficient)"
+                # Parsing failed
+                storage_ok = True
+                storage_status = f"{target_max_pdb_storage} (unable to parse, treating as sufficient)"
 
-        validation_results.append({
-            'check': 'MAX_PDB_STORAGE Limit',
-            'status': 'PASS' if storage_ok else 'FAILED',
-            'source_value': f"{source_data['pdb_size_gb']} GB (limit: {source_max_pdb_storage})",
-            'target_value': storage_status
-        })
+            yield CheckResult(
+                check='MAX_PDB_STORAGE Limit',
+                status='SKIPPED' if storage_ok is None else ('PASS' if storage_ok else 'FAILED'),
+                source_value=f"{source_data['pdb_size_gb']} GB (limit: {source_max_pdb_storage})",
+                target_value=storage_status
+            )
 
-    except Exception as e:
-        # If we can't check MAX_PDB_STORAGE, add a SKIPPED result
-        emit_progress(f"WARNING: Could not check MAX_PDB_STORAGE: {str(e)}")
-        validation_results.append({
-            'check': 'MAX_PDB_STORAGE Limit',
-            'status': 'SKIPPED',
-            'source_value': f"{source_data['pdb_size_gb']} GB",
-            'target_value': 'Could not verify (connection issue)'
-        })
-
-    # Check 10: DBMS_PDB.CHECK_PLUG_COMPATIBILITY
-    emit_progress("Checking plug compatibility (using CLOB method)...")
-
-    # Use CLOB-based method instead of file-based
-    # This works across platforms without needing file system access
-    try:
-        # IMPORTANT: DBMS_PDB.DESCRIBE must be run from the CDB context (not PDB)
-        # We use the existing source_cursor which is already connected to the CDB
-        emit_progress(f"DEBUG: Using CDB connection for DBMS_PDB.DESCRIBE")
-        emit_progress(f"DEBUG: Source CDB DSN = {source_scan}:{source_port}/{source_cdb}")
-
-        # Verify we're connected to CDB
-        source_cursor.execute("SELECT sys_context('USERENV', 'CON_NAME') FROM dual")
-        current_container = source_cursor.fetchone()[0]
-        emit_progress(f"DEBUG: Current container context = {current_container}")
-
-        # Query the actual DBMS_PDB.DESCRIBE signature from the database
-        emit_progress(f"DEBUG: Querying DBMS_PDB.DESCRIBE signature from database...")
-        source_cursor.execute("""
-            SELECT argument_name, position, data_type, in_out, data_level, overload
-            FROM all_arguments
-            WHERE owner = 'SYS'
-            AND package_name = 'DBMS_PDB'
-            AND object_name = 'DESCRIBE'
-            ORDER BY overload NULLS FIRST, position
-        """)
-        describe_signature = source_cursor.fetchall()
-
-        emit_progress(f"DEBUG: DBMS_PDB.DESCRIBE signature in this Oracle version:")
-
-        # Check if this is file-based or CLOB-based signature
-        # Oracle 19c+ has MULTIPLE overloads - we need to detect which ones are available
-        has_clob_overload = False
-        has_file_overload = False
-
-        if describe_signature:
-            # Group by overload number
-            overloads = {}
-            for arg in describe_signature:
-                arg_name = arg[0] or 'RETURN_VALUE'
-                overload_num = arg[5] if len(arg) > 5 else None
-
-                if overload_num not in overloads:
-                    overloads[overload_num] = []
-                overloads[overload_num].append(arg)
-
-                emit_progress(f"DEBUG:   Overload {overload_num}, Position {arg[1]}: {arg_name} ({arg[2]}, {arg[3]}, Level={arg[4]})")
-
-            # Check each overload
-            for overload_num, params_list in overloads.items():
-                # Check if this overload is CLOB-based (first param is CLOB OUT)
-                if params_list:
-                    # Find the parameter at position 1 (first parameter)
-                    first_param = None
-                    for param in params_list:
-                        if param[1] == 1:  # position == 1
-                            first_param = param
-                            break
-
-                    if first_param:
-                        param_name = first_param[0] or 'RETURN_VALUE'
-                        param_type = first_param[2]
-                        param_direction = first_param[3]
-
-                        # CLOB overload: PDB_DESCR_XML CLOB OUT
-                        if param_type == 'CLOB' and param_direction == 'OUT':
-                            has_clob_overload = True
-                            emit_progress(f"DEBUG: Found CLOB-based overload (Overload {overload_num}): {param_name} ({param_type} {param_direction})")
-                        # File overload: PDB_DESCR_FILE VARCHAR2 IN
-                        elif param_type == 'VARCHAR2' and param_direction == 'IN' and 'FILE' in str(param_name).upper():
-                            has_file_overload = True
-                            emit_progress(f"DEBUG: Found file-based overload (Overload {overload_num}): {param_name} ({param_type} {param_direction})")
-        else:
-            emit_progress(f"DEBUG:   No signature found - DESCRIBE procedure may not exist!")
-
-        # Note: Even if all_arguments only shows file-based signature,
-        # Oracle 19c+ may still support CLOB overload
-        # We'll try CLOB methods first, and only skip if they all fail
-        if has_file_overload and not has_clob_overload:
-            emit_progress(f"")
-            emit_progress(f"INFO: all_arguments shows file-based signature")
-            emit_progress(f"INFO: However, Oracle 19c+ typically supports CLOB overload")
-            emit_progress(f"INFO: Attempting CLOB-based methods first...")
-            emit_progress(f"")
-
-        # Create CLOB variable for XML output
-        xml_var = source_cursor.var(oracledb.DB_TYPE_CLOB)
-        emit_progress(f"DEBUG: Created CLOB variable for XML output")
-
-        # Try different calling methods based on Oracle documentation
-        # Method 1: Two parameters - CLOB and PDB name (Oracle 19c+ when called from CDB)
-        plsql_block_method1 = """
-            DECLARE
-                v_pdb_name VARCHAR2(128) := :pdb_name;
-            BEGIN
-                DBMS_PDB.DESCRIBE(
-                    pdb_descr_xml => :xml_output,
-                    pdb_name => v_pdb_name
-                );
-            END;
-        """
-
-        # Method 2: Two parameters (Oracle 12.1/12.2 style)
-        # In Oracle 12c, DBMS_PDB.DESCRIBE requires the PDB name as second parameter
-        plsql_block_method2 = """
-            DECLARE
-                v_pdb_name VARCHAR2(128) := :pdb_name;
-            BEGIN
-                DBMS_PDB.DESCRIBE(
-                    pdb_descr_xml => :xml_output,
-                    pdb_name => v_pdb_name
-                );
-            END;
-        """
-
-        # Method 3: Positional parameters (Oracle 12c alternative)
-        plsql_block_method3 = """
-            DECLARE
-                v_pdb_name VARCHAR2(128) := :pdb_name;
-            BEGIN
-                DBMS_PDB.DESCRIBE(:xml_output, v_pdb_name);
-            END;
-        """
-
-        # Method 4: File-based with DBMS_LOB (Oracle 12.1/12.2)
-        # This method writes to a file in the database server DATA_PUMP_DIR
-        # then reads it back using DBMS_LOB
-        plsql_block_method4 = """
-            DECLARE
-                v_pdb_name VARCHAR2(128) := :pdb_name;
-                v_filename VARCHAR2(100) := 'pdb_describe_' || TO_CHAR(SYSDATE, 'YYYYMMDDHH24MISS') || '.xml';
-                v_dir VARCHAR2(30) := 'DATA_PUMP_DIR';
-                v_file_handle UTL_FILE.FILE_TYPE;
-                v_clob CLOB;
-                v_line VARCHAR2(32767);
-            BEGIN
-                -- Step 1: Generate XML file using DBMS_PDB.DESCRIBE
-                DBMS_PDB.DESCRIBE(
-                    pdb_descr_file => v_filename,
-                    pdb_name => v_pdb_name
-                );
-
-                -- Step 2: Read the file into a CLOB
-                DBMS_LOB.CREATETEMPORARY(v_clob, TRUE);
-                v_file_handle := UTL_FILE.FOPEN(v_dir, v_filename, 'R', 32767);
-
-                BEGIN
-                    LOOP
-                        UTL_FILE.GET_LINE(v_file_handle, v_line);
-                        DBMS_LOB.WRITEAPPEND(v_clob, LENGTH(v_line) + 1, v_line || CHR(10));
-                    END LOOP;
-                EXCEPTION
-                    WHEN NO_DATA_FOUND THEN
-                        NULL;  -- End of file reached
-                END;
-
-                UTL_FILE.FCLOSE(v_file_handle);
-
-                -- Step 3: Delete the temporary file
-                UTL_FILE.FREMOVE(v_dir, v_filename);
-
-                -- Step 4: Return the CLOB
-                :xml_output := v_clob;
-            END;
-        """
-
-        emit_progress(f"DEBUG: Attempting Method 1 - CLOB with PDB name from CDB (Oracle 19c+)...")
-        emit_progress(f"DEBUG: PL/SQL Block:\n{plsql_block_method1}")
-
-        method_succeeded = False
+        except Exception as e:
+            # If we can't check MAX_PDB_STORAGE, add a SKIPPED result
+            emit_progress(f"WARNING: Could not check MAX_PDB_STORAGE: {str(e)}")
+            yield CheckResult(
+                check='MAX_PDB_STORAGE Limit',
+                status='SKIPPED',
+                source_value=f"{source_data['pdb_size_gb']} GB",
+                target_value='Could not verify (connection issue)'
+            )
+
+        # Check 10: DBMS_PDB.CHECK_PLUG_COMPATIBILITY
+        emit_progress("Checking plug compatibility (using CLOB method)...")
+
+        # Use CLOB-based method instead of file-based
+        # This works across platforms without needing file system access
         try:
-            source_cursor.execute(plsql_block_method1, xml_output=xml_var, pdb_name=source_pdb)
-            emit_progress(f"DEBUG: Method 1 succeeded!")
-            method_succeeded = True
-        except Exception as e1:
-            emit_progress(f"DEBUG: Method 1 failed: {str(e1)}")
-            emit_progress(f"DEBUG: Attempting Method 2 - CLOB positional with PDB name (Oracle 12c)...")
-            emit_progress(f"DEBUG: PL/SQL Block:\n{plsql_block_method2}")
-
-            try:
-                # Reset CLOB variable
-                xml_var = source_cursor.var(oracledb.DB_TYPE_CLOB)
-                source_cursor.execute(plsql_block_method2, xml_output=xml_var, pdb_name=source_pdb)
-                emit_progress(f"DEBUG: Method 2 succeeded!")
-                method_succeeded = True
-            except Exception as e2:
-                emit_progress(f"DEBUG: Method 2 also failed: {str(e2)}")
-                emit_progress(f"DEBUG: Attempting Method 3 - Positional CLOB and PDB name (Oracle 12c alt)...")
-                emit_progress(f"DEBUG: PL/SQL Block:\n{plsql_block_method3}")
-
+            # IMPORTANT: DBMS_PDB.DESCRIBE must be run from the CDB context (not PDB)
+            # We use the existing source_cursor which is already connected to the CDB
+            emit_debug("Using CDB connection for DBMS_PDB.DESCRIBE")
+            emit_debug(lambda: f"Source CDB DSN = {source_scan}:{source_port}/{source_cdb}")
+
+            # Verify we're connected to CDB (diagnostic only - costs a round trip)
+            if debug:
+                source_cursor.execute("SELECT sys_context('USERENV', 'CON_NAME') FROM dual")
+                emit_debug(f"Current container context = {source_cursor.fetchone()[0]}")
+
+            # Create CLOB variable for XML output
+            xml_var = source_cursor.var(oracledb.DB_TYPE_CLOB)
+            emit_debug("Created CLOB variable for XML output")
+
+            # Reuse the calling method that worked last time for this CDB and version
+            describe_key = (source_cdb_dsn, source_data.get('version_full'))
+
+            method_succeeded = False
+            cached_method = _DESCRIBE_METHOD_CACHE.get(describe_key)
+            if cached_method is not None:
+                plsql_block, label = _DESCRIBE_METHODS[cached_method]
+                emit_debug(lambda: f"Using cached Method {cached_method} - {label}...")
                 try:
-                    # Reset CLOB variable
-                    xml_var = source_cursor.var(oracledb.DB_TYPE_CLOB)
-                    source_cursor.execute(plsql_block_method3, xml_output=xml_var, pdb_name=source_pdb)
-                    emit_progress(f"DEBUG: Method 3 succeeded!")
+                    source_cursor.execute(plsql_block, _describe_binds(cached_method, xml_var, source_pdb))
+                    emit_debug(lambda: f"Method {cached_method} succeeded!")
                     method_succeeded = True
-                except Exception as e3:
-                    emit_progress(f"DEBUG: Method 3 also failed: {str(e3)}")
-                    emit_progress(f"DEBUG: Attempting Method 4 - File-based with DBMS_LOB (Oracle 12c)...")
-                    emit_progress(f"DEBUG: This method writes to DATA_PUMP_DIR and reads back")
+                except oracledb.DatabaseError as e:
+                    # The signature may have changed (e.g. after patching): forget it and probe again
+                    emit_debug(lambda: f"Cached Method {cached_method} failed: {str(e)}")
+                    _DESCRIBE_METHOD_CACHE.pop(describe_key, None)
+                    xml_var = source_cursor.var(oracledb.DB_TYPE_CLOB)
+
+            if not method_succeeded:
+                # Query the actual DBMS_PDB.DESCRIBE signature from the database (once per Oracle version)
+                emit_debug("Querying DBMS_PDB.DESCRIBE signature from database...")
+                describe_signature = _describe_signature(source_cursor, source_data.get('version_full'))
+
+                emit_debug("DBMS_PDB.DESCRIBE signature in this Oracle version:")
+
+                # Check if this is file-based or CLOB-based signature
+                # Oracle 19c+ has MULTIPLE overloads - we need to detect which ones are available
+                has_clob_overload = False
+                has_file_overload = False
+
+                if describe_signature:
+                    # Group by overload number
+                    overloads = {}
+                    for arg in describe_signature:
+                        arg_name = arg[0] or 'RETURN_VALUE'
+                        overload_num = arg[5] if len(arg) > 5 else None
+
+                        if overload_num not in overloads:
+                            overloads[overload_num] = []
+                        overloads[overload_num].append(arg)
+
+                        emit_debug(lambda: f"  Overload {overload_num}, Position {arg[1]}: {arg_name} ({arg[2]}, {arg[3]}, Level={arg[4]})")
+
+                    # Check each overload
+                    for overload_num, params_list in overloads.items():
+                        # Check if this overload is CLOB-based (first param is CLOB OUT)
+                        if params_list:
+                            # Find the parameter at position 1 (first parameter)
+                            first_param = None
+                            for param in params_list:
+                                if param[1] == 1:  # position == 1
+                                    first_param = param
+                                    break
+
+                            if first_param:
+                                param_name = first_param[0] or 'RETURN_VALUE'
+                                param_type = first_param[2]
+                                param_direction = first_param[3]
+
+                                # CLOB overload: PDB_DESCR_XML CLOB OUT
+                                if param_type == 'CLOB' and param_direction == 'OUT':
+                                    has_clob_overload = True
+                                    emit_debug(lambda: f"Found CLOB-based overload (Overload {overload_num}): {param_name} ({param_type} {param_direction})")
+                                # File overload: PDB_DESCR_FILE VARCHAR2 IN
+                                elif param_type == 'VARCHAR2' and param_direction == 'IN' and 'FILE' in str(param_name).upper():
+                                    has_file_overload = True
+                                    emit_debug(lambda: f"Found file-based overload (Overload {overload_num}): {param_name} ({param_type} {param_direction})")
+                else:
+                    emit_debug("  No signature found - DESCRIBE procedure may not exist!")
+
+                # The signature decides the call: the CLOB overload (named binds, then
+                # positional as a fallback) or the file-based overload via DATA_PUMP_DIR
+                if has_clob_overload:
+                    candidate_methods = (1, 3)
+                elif has_file_overload:
+                    emit_progress(f"INFO: all_arguments shows file-based signature only - using the file-based method")
+                    candidate_methods = (4,)
+                else:
+                    raise RuntimeError("DBMS_PDB.DESCRIBE signature not found in all_arguments")
 
+                # Remember the first candidate that works
+                for method_num in candidate_methods:
+                    plsql_block, label = _DESCRIBE_METHODS[method_num]
+                    emit_debug(lambda: f"Attempting Method {method_num} - {label}...")
+                    emit_debug(lambda: f"PL/SQL Block:\n{plsql_block}")
                     try:
+                        source_cursor.execute(plsql_block, _describe_binds(method_num, xml_var, source_pdb))
+                        emit_debug(lambda: f"Method {method_num} succeeded!")
+                        _DESCRIBE_METHOD_CACHE[describe_key] = method_num
+                        method_succeeded = True
+                        break
+                    except Exception as e:
+                        emit_debug(lambda: f"Method {method_num} failed: {str(e)}")
                         # Reset CLOB variable
                         xml_var = source_cursor.var(oracledb.DB_TYPE_CLOB)
-                        source_cursor.execute(plsql_block_method4, xml_output=xml_var, pdb_name=source_pdb)
-                        emit_progress(f"DEBUG: Method 4 succeeded!")
-                        method_succeeded = True
-                    except Exception as e4:
-                        emit_progress(f"DEBUG: Method 4 also failed: {str(e4)}")
-                        emit_progress(f"")
-                        emit_progress(f"NOTICE: All 4 DBMS_PDB.DESCRIBE methods failed")
-                        emit_progress(f"NOTICE: Your Oracle version appears to only support file-based approach")
-                        emit_progress(f"NOTICE: File-based approach requires server filesystem access")
-                        emit_progress(f"NOTICE: Skipping DBMS_PDB plug compatibility check")
-                        emit_progress(f"")
-                        emit_progress(f"RECOMMENDATION: Run the compatibility check manually using SQL*Plus:")
-                        emit_progress(f"  1. Connect to source PDB: sqlplus user/pass@{source_scan}:{source_port}/{source_pdb}")
-                        emit_progress(f"  2. Run: EXEC DBMS_PDB.DESCRIBE(pdb_descr_file => 'pdb_desc.xml', pdb_name => '{source_pdb}');")
-                        emit_progress(f"  3. Copy pdb_desc.xml from DATA_PUMP_DIR on source to target")
-                        emit_progress(f"  4. Connect to target CDB: sqlplus user/pass@{source_scan}:{source_port}/{target_cdb}")
-                        emit_progress(f"  5. Run: SELECT DBMS_PDB.CHECK_PLUG_COMPATIBILITY(pdb_descr_file => 'pdb_desc.xml') FROM dual;")
-                        emit_progress(f"")
-                        # Raise a special exception to indicate we should skip gracefully
-                        raise Exception("ALL_METHODS_FAILED_FILE_BASED_ONLY")
-
-        if not method_succeeded:
-            raise Exception("All DBMS_PDB.DESCRIBE methods failed")
-
-        emit_progress(f"DEBUG: DBMS_PDB.DESCRIBE executed successfully")
-
-        xml_clob = xml_var.getvalue()
-
-        # Export XML to file for inspection
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        xml_filename = f"{source_cdb}_{source_pdb}_pdb_describe_{timestamp}.xml"
-
-        if xml_clob:
-            xml_content = xml_clob.read() if hasattr(xml_clob, 'read') else str(xml_clob)
-            with open(xml_filename, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
-            emit_progress(f"DEBUG: XML exported to file: {xml_filename}")
-            emit_progress(f"DEBUG: XML length = {len(xml_content)} characters")
-        else:
-            emit_progress(f"DEBUG: WARNING - XML CLOB is empty/None!")
-
-        # No need to close - using existing CDB connection
-        emit_progress(f"DEBUG: DBMS_PDB.DESCRIBE completed from CDB context")
-
-        # Check compatibility on target using the XML CLOB
-        emit_progress(f"DEBUG: Running DBMS_PDB.CHECK_PLUG_COMPATIBILITY on target CDB...")
-
-        result_var = target_cursor.var(str)
-
-        check_compat_block = """
-            DECLARE
-                v_compatible BOOLEAN;
-            BEGIN
-                v_compatible := DBMS_PDB.CHECK_PLUG_COMPATIBILITY(
-                    pdb_descr_xml => :xml_input
-                );
-                IF v_compatible THEN
-                    :result := 'TRUE';
-                ELSE
-                    :result := 'FALSE';
-                END IF;
-            END;
-        """
-
-        emit_progress(f"DEBUG: Executing CHECK_PLUG_COMPATIBILITY...")
-        target_cursor.execute(check_compat_block, xml_input=xml_clob, result=result_var)
-
-        compatibility_result = result_var.getvalue()
-        emit_progress(f"DEBUG: Compatibility check result = {compatibility_result}")
-
-        # Query violations if incompatible
-        violations = []
-        if compatibility_result == 'FALSE':
-            target_cursor.execute("""
-                SELECT name, cause, type, message, status, action
-                FROM pdb_plug_in_violations
-                WHERE status != 'RESOLVED'
-                ORDER BY time DESC
-                FETCH FIRST 20 ROWS ONLY
-            """)
-            violations = target_cursor.fetchall()
-
-        emit_progress(f"DEBUG: Compatibility check completed successfully")
-
-        validation_results.append({
-            'check': 'DBMS_PDB Plug Compatibility',
-            'status': 'PASS' if compatibility_result == 'TRUE' else 'FAILED',
-            'source_value': 'XML generated (CLOB)',
-            'target_value': compatibility_result,
-            'violations': violations
-        })
+                else:
+                    emit_progress(f"")
+                    emit_progress(f"NOTICE: All DBMS_PDB.DESCRIBE methods for this signature failed")
+                    emit_progress(f"NOTICE: Your Oracle version appears to only support file-based approach")
+                    emit_progress(f"NOTICE: File-based approach requires server filesystem access")
+                    emit_progress(f"NOTICE: Skipping DBMS_PDB plug compatibility check")
+                    emit_progress(f"")
+                    emit_progress(f"RECOMMENDATION: Run the compatibility check manually using SQL*Plus:")
+                    emit_progress(f"  1. Connect to source PDB: sqlplus user/pass@{source_scan}:{source_port}/{source_pdb}")
+                    emit_progress(f"  2. Run: EXEC DBMS_PDB.DESCRIBE(pdb_descr_file => 'pdb_desc.xml', pdb_name => '{source_pdb}');")
+                    emit_progress(f"  3. Copy pdb_desc.xml from DATA_PUMP_DIR on source to target")
+                    emit_progress(f"  4. Connect to target CDB: sqlplus user/pass@{source_scan}:{source_port}/{target_cdb}")
+                    emit_progress(f"  5. Run: SELECT DBMS_PDB.CHECK_PLUG_COMPATIBILITY(pdb_descr_file => 'pdb_desc.xml') FROM dual;")
+                    emit_progress(f"")
+                    # Raise a special exception to indicate we should skip gracefully
+                    raise Exception("ALL_METHODS_FAILED_FILE_BASED_ONLY")
+
+            emit_debug("DBMS_PDB.DESCRIBE executed successfully")
+
+            xml_clob = xml_var.getvalue()
+
+            if xml_clob:
+                # Export XML to file for inspection when requested, from the same chunks
+                # that fill the target-side temporary CLOB bound below
+                xml_filename = None
+                if params.get('debug_dump_xml'):
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    xml_filename = f"{source_cdb}_{source_pdb}_pdb_describe_{timestamp}.xml"
+                xml_clob, xml_length, dump_error = _copy_clob(xml_clob, target_conn, xml_filename)
+                emit_debug(lambda: f"XML length = {xml_length} characters")
+
+                if dump_error is not None:
+                    emit_progress(f"WARNING: Could not write {xml_filename}: {dump_error}")
+                elif xml_filename:
+                    emit_progress(f"XML exported to: {xml_filename}")
+            else:
+                emit_debug("WARNING - XML CLOB is empty/None!")
 
-    except Exception as e:
-        # Check if this is the intentional skip for file-based Oracle versions
-        if str(e) == "SKIP_FILE_BASED_CHECK" or str(e) == "ALL_METHODS_FAILED_FILE_BASED_ONLY":
-            # Already added the SKIPPED result and displayed user message
-            # No need to show error - this is expected for file-based only versions
-            emit_progress(f"INFO: Continuing with remaining validation checks...")
-
-            # Add SKIPPED result if not already added
-            validation_results.append({
-                'check': 'DBMS_PDB Plug Compatibility',
-                'status': 'SKIPPED',
-                'source_value': 'N/A',
-                'target_value': 'File-based only (requires manual check)'
-            })
-        else:
-            # If CLOB method fails for other reasons, skip this check
-            import traceback
-            error_details = traceback.format_exc()
-
-            emit_progress(f"ERROR: Plug compatibility check failed!")
-            emit_progress(f"ERROR: Exception type: {type(e).__name__}")
-            emit_progress(f"ERROR: Exception message: {str(e)}")
-            emit_progress(f"ERROR: Full traceback:")
-            for line in error_details.split('\n'):
-                if line.strip():
-                    emit_progress(f"  {line}")
-
-            validation_results.append({
-                'check': 'DBMS_PDB Plug Compatibility',
-                'status': 'SKIPPED',
-                'source_value': 'Check failed',
-                'target_value': f'Error: {str(e)}',
-                'violations': []
-            })
-
-    # Gather Oracle CDB parameters for comparison
-    emit_progress("Gathering Oracle CDB parameters...")
-    source_cursor.execute("""
-        SELECT name, value, isdefault
-        FROM v$parameter
-        WHERE isdefault = 'FALSE'
-        ORDER BY name
-    """)
-    source_data['cdb_parameters'] = source_cursor.fetchall()
-
-    target_cursor.execute("""
-        SELECT name, value, isdefault
-        FROM v$parameter
-        WHERE isdefault = 'FALSE'
-        ORDER BY name
-    """)
-    target_data['cdb_parameters'] = target_cursor.fetchall()
-
-    # Gather Oracle PDB parameters
-    emit_progress("Gathering Oracle source PDB parameters...")
-    source_pdb_dsn = f"{source_scan}:{source_port}/{source_pdb}"
+            # No need to close - using existing CDB connection
+            emit_debug("DBMS_PDB.DESCRIBE completed from CDB context")
 
-    try:
-        if connection_mode == 'external_auth':
-            emit_progress(f"Connecting to Source PDB: {source_pdb_dsn} (External Auth)")
-            source_pdb_conn = oracledb.connect(dsn=source_pdb_dsn, externalauth=True)
-        else:
-            source_user = params.get('source_username')
-            source_pass = params.get('source_password')
-            emit_progress(f"Connecting to Source PDB: {source_pdb_dsn} (User: {source_user})")
-            source_pdb_conn = oracledb.connect(user=source_user, password=source_pass, dsn=source_pdb_dsn)
-
-        source_pdb_cursor = source_pdb_conn.cursor()
-        source_pdb_cursor.execute("""
-            SELECT name, value, isdefault
-            FROM v$parameter
-            WHERE isdefault = 'FALSE'
-            ORDER BY name
-        """)
-        source_data['pdb_parameters'] = source_pdb_cursor.fetchall()
-        source_pdb_cursor.close()
-        source_pdb_conn.close()
-    except Exception as e:
-        emit_progress(f"Warning: Could not gather source PDB parameters: {str(e)}")
-        source_data['pdb_parameters'] = []
+            # Check compatibility on target using the XML CLOB (now a target-side temporary LOB)
+            emit_debug("Running DBMS_PDB.CHECK_PLUG_COMPATIBILITY on target CDB...")
 
-    # For target PDB parameters, try to connect if target PDB exists
-    target_pdb_exists = target_data.get('pdb_mode') and target_data['pdb_mode'] != 'Does not exist'
+            result_var = target_cursor.var(str)
 
-    if target_pdb_exists:
-        emit_progress("Gathering Oracle target PDB parameters...")
-        target_pdb_dsn = f"{target_scan}:{target_port}/{target_pdb}"
+            emit_debug("Executing CHECK_PLUG_COMPATIBILITY...")
+            target_cursor.execute(_PLSQL_CHECK_COMPAT, xml_input=xml_clob, result=result_var)
+
+            compatibility_result = result_var.getvalue()
+            emit_debug(lambda: f"Compatibility check result = {compatibility_result}")
+
+            # Query violations if incompatible
+            violations = []
+            if compatibility_result == 'FALSE':
+                target_cursor.execute("""
+                    SELECT name, cause, type, message, status, action
+                    FROM pdb_plug_in_violations
+                    WHERE status != 'RESOLVED'
+                    ORDER BY time DESC
+                    FETCH FIRST 20 ROWS ONLY
+                """)
+                violations = target_cursor.fetchall()
+
+            emit_debug("Compatibility check completed successfully")
+
+            yield CheckResult(
+                check='DBMS_PDB Plug Compatibility',
+                status='PASS' if compatibility_result == 'TRUE' else 'FAILED',
+                source_value='XML generated (CLOB)',
+                target_value=compatibility_result,
+                violations=violations
+            )
 
-        try:
-            if connection_mode == 'external_auth':
-                emit_progress(f"Connecting to Target PDB: {target_pdb_dsn} (External Auth)")
-                target_pdb_conn = oracledb.connect(dsn=target_pdb_dsn, externalauth=True)
-            else:
-                target_user = params.get('target_username')
-                target_pass = params.get('target_password')
-                emit_progress(f"Connecting to Target PDB: {target_pdb_dsn} (User: {target_user})")
-                target_pdb_conn = oracledb.connect(user=target_user, password=target_pass, dsn=target_pdb_dsn)
-
-            target_pdb_cursor = target_pdb_conn.cursor()
-            target_pdb_cursor.execute("""
-                SELECT name, value, isdefault
-                FROM v$parameter
-                WHERE isdefault = 'FALSE'
-                ORDER BY name
-            """)
-            target_data['pdb_parameters'] = target_pdb_cursor.fetchall()
-            target_pdb_cursor.close()
-            target_pdb_conn.close()
         except Exception as e:
-            emit_progress(f"Warning: Could not gather target PDB parameters: {str(e)}")
+            # Check if this is the intentional skip for file-based Oracle versions
+            if str(e) == "SKIP_FILE_BASED_CHECK" or str(e) == "ALL_METHODS_FAILED_FILE_BASED_ONLY":
+                # Already added the SKIPPED result and displayed user message
+                # No need to show error - this is expected for file-based only versions
+                emit_progress(f"INFO: Continuing with remaining validation checks...")
+
+                # Add SKIPPED result if not already added
+                yield CheckResult(
+                    check='DBMS_PDB Plug Compatibility',
+                    status='SKIPPED',
+                    source_value='N/A',
+                    target_value='File-based only (requires manual check)'
+                )
+            else:
+                # If CLOB method fails for other reasons, skip this check
+                import traceback
+                error_details = traceback.format_exc()
+
+                emit_progress(f"ERROR: Plug compatibility check failed!")
+                emit_progress(f"ERROR: Exception type: {type(e).__name__}")
+                emit_progress(f"ERROR: Exception message: {str(e)}")
+                emit_progress(f"ERROR: Full traceback:")
+                for line in error_details.split('\n'):
+                    if line.strip():
+                        emit_progress(f"  {line}")
+
+                yield CheckResult(
+                    check='DBMS_PDB Plug Compatibility',
+                    status='SKIPPED',
+                    source_value='Check failed',
+                    target_value=f'Error: {str(e)}',
+                    violations=[]
+                )
+
+        # Gather Oracle CDB parameters for comparison
+        emit_progress("Gathering Oracle CDB parameters...")
+        source_data['cdb_parameters'], target_data['cdb_parameters'] = cdb_facts['cdb_parameters']
+
+        # Gather Oracle PDB parameters
+        # (read over the CDB sessions by switching container - no PDB logons)
+        # (the source read overlaps the target one on the worker thread)
+        emit_progress("Gathering Oracle source PDB parameters...")
+
+        # Target PDB parameters, if the target PDB exists
+        target_pdb_exists = target_data.get('pdb_mode') and target_data['pdb_mode'] != 'Does not exist'
+
+        if target_pdb_exists:
+            emit_progress("Gathering Oracle target PDB parameters...")
+            (source_data['pdb_parameters'], source_error), (target_data['pdb_parameters'], target_error) = \
+                _run_pair(_non_default_params, (source_cursor, source_pdb_u), (target_cursor, target_pdb_u))
+            if target_error is not None:
+                emit_progress(f"Warning: Could not gather target PDB parameters: {str(target_error)}")
+        else:
+            emit_progress("Target PDB does not exist - skipping target PDB parameter gathering")
+            source_data['pdb_parameters'], source_error = _non_default_params(source_cursor, source_pdb_u)
             target_data['pdb_parameters'] = []
-    else:
-        emit_progress("Target PDB does not exist - skipping target PDB parameter gathering")
-        target_data['pdb_parameters'] = []
 
-    source_cursor.close()
-    target_cursor.close()
-    source_conn.close()
-    target_conn.close()
+        if source_error is not None:
+            emit_progress(f"Warning: Could not gather source PDB parameters: {str(source_error)}")
+
+        emit_progress("Precheck validation completed")
+
+
+def perform_pdb_precheck(params, progress_callback=None, fail_fast=False):
+    """
+    Perform PDB clone precheck validations.
 
-    emit_progress("Precheck validation completed")
+    Args:
+        params (dict): Parameters for precheck (see iter_pdb_precheck)
+        progress_callback (callable, optional): Function to call with progress messages
+        fail_fast (bool): Stop at the first FAILED check instead of running the rest
+
+    Returns:
+        tuple: (validation_results, source_data, target_data)
+    """
+    validation_results = []
+    source_data = {}
+    target_data = {}
+
+    checks = iter_pdb_precheck(params, source_data, target_data, progress_callback)
+    for result in checks:
+        validation_results.append(result)
+        if fail_fast and result.status == 'FAILED':
+            # Closing the generator runs its cleanup and skips all further SQL
+            checks.close()
+            if progress_callback:
+                progress_callback(f"Precheck stopped at failed check: {result.check}")
+            break
 
     return (validation_results, source_data, target_data)
 
@@ -883,8 +1199,9 @@ def perform_pdb_clone(params, progress_callback=None):
         str: Success message
     """
     def emit_progress(message):
+        # message may be a zero-argument callable, formatted only when someone is listening
         if progress_callback:
-            progress_callback(message)
+            progress_callback(message() if callable(message) else message)
 
     connection_mode = params.get('connection_mode', 'external_auth')
     source_scan = params.get('source_scan')
@@ -905,58 +1222,55 @@ def perform_pdb_clone(params, progress_callback=None):
     # Connect to target CDB
     if connection_mode == 'external_auth':
         emit_progress(f"Connecting to Target CDB: {target_cdb_dsn} (External Auth)")
-        target_conn = oracledb.connect(dsn=target_cdb_dsn, externalauth=True)
+        target_conn = _get_conn(target_cdb_dsn, connection_mode)
     else:
         target_user = params.get('target_username')
         target_pass = params.get('target_password')
         emit_progress(f"Connecting to Target CDB: {target_cdb_dsn} (User: {target_user})")
-        target_conn = oracledb.connect(user=target_user, password=target_pass, dsn=target_cdb_dsn)
-
-    target_cursor = target_conn.cursor()
+        target_conn = _get_conn(target_cdb_dsn, connection_mode, target_user, target_pass)
 
-    # Create database link
-    link_name = f"CLONE_LINK_{source_pdb}"
-    emit_progress(f"Creating database link: {link_name}")
-
-    try:
-        target_cursor.execute(f"DROP DATABASE LINK {link_name}")
-    except:
-        pass  # Link may not exist
+    # Leaving the block returns the session to its pool, on success or error
+    with target_conn, target_conn.cursor() as target_cursor:
+        # Create database link
+        link_name = f"CLONE_LINK_{source_pdb}"
+        emit_progress(f"Creating database link: {link_name}")
 
-    # Create database link with TNS descriptor
-    tns_descriptor = f"(DESCRIPTION=(ADDRESS=(PROTOCOL=TCP)(HOST={source_scan})(PORT={source_port}))(CONNECT_DATA=(SERVICE_NAME={source_cdb})))"
+        try:
+            target_cursor.execute(f"DROP DATABASE LINK {link_name}")
+        except:
+            pass  # Link may not exist
 
-    target_cursor.execute(f"""
-        CREATE PUBLIC DATABASE LINK {link_name}
-        CONNECT TO CURRENT_USER
-        USING '{tns_descriptor}'
-    """)
-    target_conn.commit()
+        # Create database link with TNS descriptor
+        tns_descriptor = f"(DESCRIPTION=(ADDRESS=(PROTOCOL=TCP)(HOST={source_scan})(PORT={source_port}))(CONNECT_DATA=(SERVICE_NAME={source_cdb})))"
 
-    # Create pluggable database
-    emit_progress(f"Cloning PDB {source_pdb} to {target_pdb}...")
+        target_cursor.execute(f"""
+            CREATE PUBLIC DATABASE LINK {link_name}
+            CONNECT TO CURRENT_USER
+            USING '{tns_descriptor}'
+        """)
+        target_conn.commit()
 
-    target_cursor.execute(f"""
-        CREATE PLUGGABLE DATABASE {target_pdb}
-        FROM {source_pdb}@{link_name}
-        FILE_NAME_CONVERT = ('/{source_pdb}/', '/{target_pdb}/')
-    """)
-    target_conn.commit()
+        # Create pluggable database
+        emit_progress(f"Cloning PDB {source_pdb} to {target_pdb}...")
 
-    emit_progress(f"Opening PDB {target_pdb}...")
-    target_cursor.execute(f"ALTER PLUGGABLE DATABASE {target_pdb} OPEN READ WRITE")
-    target_conn.commit()
+        target_cursor.execute(f"""
+            CREATE PLUGGABLE DATABASE {target_pdb}
+            FROM {source_pdb}@{link_name}
+            FILE_NAME_CONVERT = ('/{source_pdb}/', '/{target_pdb}/')
+        """)
+        target_conn.commit()
 
-    emit_progress(f"Saving PDB state...")
-    target_cursor.execute(f"ALTER PLUGGABLE DATABASE {target_pdb} SAVE STATE")
-    target_conn.commit()
+        emit_progress(f"Opening PDB {target_pdb}...")
+        target_cursor.execute(f"ALTER PLUGGABLE DATABASE {target_pdb} OPEN READ WRITE")
+        target_conn.commit()
 
-    # Clean up database link
-    target_cursor.execute(f"DROP DATABASE LINK {link_name}")
-    target_conn.commit()
+        emit_progress(f"Saving PDB state...")
+        target_cursor.execute(f"ALTER PLUGGABLE DATABASE {target_pdb} SAVE STATE")
+        target_conn.commit()
 
-    target_cursor.close()
-    target_conn.close()
+        # Clean up database link
+        target_cursor.execute(f"DROP DATABASE LINK {link_name}")
+        target_conn.commit()
 
     emit_progress("PDB clone completed successfully!")
 
@@ -979,8 +1293,9 @@ def perform_pdb_postcheck(params, progress_callback=None):
         tuple: (validation_results, source_data, target_data, param_differences)
     """
     def emit_progress(message):
+        # message may be a zero-argument callable, formatted only when someone is listening
         if progress_callback:
-            progress_callback(message)
+            progress_callback(message() if callable(message) else message)
 
     connection_mode = params.get('connection_mode', 'external_auth')
     source_scan = params.get('source_scan')
@@ -992,129 +1307,65 @@ def perform_pdb_postcheck(params, progress_callback=None):
     target_cdb = params.get('target_cdb')
     target_pdb = params.get('target_pdb')
 
+    # v$pdbs and cdb_services store names in uppercase: fold the binds once here
+    source_pdb_u = (source_pdb or '').upper()
+    target_pdb_u = (target_pdb or '').upper()
+
     emit_progress("Starting PDB clone postcheck...")
 
     # Build connection strings
     source_cdb_dsn = f"{source_scan}:{source_port}/{source_cdb}"
     target_cdb_dsn = f"{target_scan}:{target_port}/{target_cdb}"
 
-    # Connect to both CDBs
-    if connection_mode == 'external_auth':
-        emit_progress(f"Connecting to Source CDB: {source_cdb_dsn} (External Auth)")
-        source_conn = oracledb.connect(dsn=source_cdb_dsn, externalauth=True)
-
-        emit_progress(f"Connecting to Target CDB: {target_cdb_dsn} (External Auth)")
-        target_conn = oracledb.connect(dsn=target_cdb_dsn, externalauth=True)
-    else:
-        source_user = params.get('source_username')
-        source_pass = params.get('source_password')
-        target_user = params.get('target_username')
-        target_pass = params.get('target_password')
-
-        emit_progress(f"Connecting to Source CDB: {source_cdb_dsn} (User: {source_user})")
-        source_conn = oracledb.connect(user=source_user, password=source_pass, dsn=source_cdb_dsn)
-
-        emit_progress(f"Connecting to Target CDB: {target_cdb_dsn} (User: {target_user})")
-        target_conn = oracledb.connect(user=target_user, password=target_pass, dsn=target_cdb_dsn)
-
     validation_results = []
     source_data = {}
     target_data = {}
 
-    source_cursor = source_conn.cursor()
-    target_cursor = target_conn.cursor()
-
-    # Gather instance and host information
-    emit_progress("Gathering instance and host information...")
-
-    # Source instance information
-    source_cursor.execute("""
-        SELECT inst_id, instance_name, host_name
-        FROM gv$instance
-        ORDER BY inst_id
-    """)
-    source_data['instances'] = source_cursor.fetchall()
-
-    # Target instance information
-    target_cursor.execute("""
-        SELECT inst_id, instance_name, host_name
-        FROM gv$instance
-        ORDER BY inst_id
-    """)
-    target_data['instances'] = target_cursor.fetchall()
-
-    # Gather PDB size information
-    emit_progress("Gathering PDB size information...")
-
-    # Source PDB size
-    source_cursor.execute("""
-        SELECT ROUND(SUM(bytes)/1024/1024/1024, 2) as size_gb
-        FROM v$datafile
-        WHERE con_id = (SELECT con_id FROM v$pdbs WHERE UPPER(name) = UPPER(:pdb_name))
-    """, pdb_name=source_pdb)
-    source_size_result = source_cursor.fetchone()
-    source_data['pdb_size_gb'] = source_size_result[0] if source_size_result and source_size_result[0] else 0
-
-    # Target PDB size
-    target_cursor.execute("""
-        SELECT ROUND(SUM(bytes)/1024/1024/1024, 2) as size_gb
-        FROM v$datafile
-        WHERE con_id = (SELECT con_id FROM v$pdbs WHERE UPPER(name) = UPPER(:pdb_name))
-    """, pdb_name=target_pdb)
-    target_size_result = target_cursor.fetchone()
-    target_data['pdb_size_gb'] = target_size_result[0] if target_size_result and target_size_result[0] else 0
-
-    # Gather Oracle parameters for both PDBs
-    emit_progress("Gathering Oracle parameters for source PDB...")
-    source_pdb_dsn = f"{source_scan}:{source_port}/{source_pdb}"
+    # Sessions go back to their pools on every exit path, errors included
+    with contextlib.ExitStack() as stack:
+        # Connect to both CDBs
+        if connection_mode == 'external_auth':
+            emit_progress(f"Connecting to Source CDB: {source_cdb_dsn} (External Auth)")
+            source_conn = stack.enter_context(_get_conn(source_cdb_dsn, connection_mode))
 
-    if connection_mode == 'external_auth':
-        emit_progress(f"Connecting to Source PDB: {source_pdb_dsn} (External Auth)")
-        source_pdb_conn = oracledb.connect(dsn=source_pdb_dsn, externalauth=True)
-    else:
-        source_user = params.get('source_username')
-        source_pass = params.get('source_password')
-        emit_progress(f"Connecting to Source PDB: {source_pdb_dsn} (User: {source_user})")
-        source_pdb_conn = oracledb.connect(user=source_user, password=source_pass, dsn=source_pdb_dsn)
-
-    source_pdb_cursor = source_pdb_conn.cursor()
-    source_pdb_cursor.execute("""
-        SELECT name, value, isdefault
-        FROM v$parameter
-        ORDER BY name
-    """)
-    source_params = {row[0]: row[1] for row in source_pdb_cursor.fetchall()}
-    source_data['parameters'] = source_params
-    source_pdb_cursor.close()
-    source_pdb_conn.close()
-
-    # Target PDB
-    target_pdb_dsn = f"{target_scan}:{target_port}/{target_pdb}"
-
-    emit_progress("Gathering Oracle parameters for target PDB...")
-    if connection_mode == 'external_auth':
-        emit_progress(f"Connecting to Target PDB: {target_pdb_dsn} (External Auth)")
-        target_pdb_conn = oracledb.connect(dsn=target_pdb_dsn, externalauth=True)
-    else:
-        target_user = params.get('target_username')
-        target_pass = params.get('target_password')
-        emit_progress(f"Connecting to Target PDB: {target_pdb_dsn} (User: {target_user})")
-        target_pdb_conn = oracledb.connect(user=target_user, password=target_pass, dsn=target_pdb_dsn)
-
-    target_pdb_cursor = target_pdb_conn.cursor()
-    target_pdb_cursor.execute("""
-        SELECT name, value, isdefault
-        FROM v$parameter
-        ORDER BY name
-    """)
-    target_params = {row[0]: row[1] for row in target_pdb_cursor.fetchall()}
-    target_data['parameters'] = target_params
-    target_pdb_cursor.close()
-    target_pdb_conn.close()
+            emit_progress(f"Connecting to Target CDB: {target_cdb_dsn} (External Auth)")
+            target_conn = stack.enter_context(_get_conn(target_cdb_dsn, connection_mode))
+        else:
+            source_user = params.get('source_username')
+            source_pass = params.get('source_password')
+            target_user = params.get('target_username')
+            target_pass = params.get('target_password')
+
+            emit_progress(f"Connecting to Source CDB: {source_cdb_dsn} (User: {source_user})")
+            source_conn = stack.enter_context(_get_conn(source_cdb_dsn, connection_mode, source_user, source_pass))
+
+            emit_progress(f"Connecting to Target CDB: {target_cdb_dsn} (User: {target_user})")
+            target_conn = stack.enter_context(_get_conn(target_cdb_dsn, connection_mode, target_user, target_pass))
+
+        source_cursor = stack.enter_context(_cursor(source_conn))
+        target_cursor = stack.enter_context(_cursor(target_conn))
+
+        # Gather instance, PDB size and service information: one block per side,
+        # source and target concurrently
+        emit_progress("Gathering instance, PDB size and service information...")
+        source_side, target_side = _run_pair(_read_postcheck_side, (source_cursor, source_pdb_u),
+                                             (target_cursor, target_pdb_u))
+        source_data['instances'], source_data['pdb_size_gb'], source_services = source_side
+        target_data['instances'], target_data['pdb_size_gb'], target_services = target_side
+        source_data['services'] = source_services
+        target_data['services'] = target_services
+
+        # Gather Oracle parameters for both PDBs
+        # (read over the CDB sessions by switching container - no PDB logons)
+        emit_progress("Gathering Oracle parameters for source and target PDBs...")
+        (source_params, _), (target_params, _) = _run_pair(_fetch_params, (source_cursor, source_pdb_u),
+                                                           (target_cursor, target_pdb_u))
+        source_data['parameters'] = source_params
+        target_data['parameters'] = target_params
 
     # Compare parameters
     emit_progress("Comparing parameters...")
-    all_keys = set(source_params.keys()) | set(target_params.keys())
+    all_keys = source_params.keys() | target_params.keys()
     param_differences = []
 
     for key in sorted(all_keys):
@@ -1124,32 +1375,15 @@ def perform_pdb_postcheck(params, progress_callback=None):
             param_differences.append((key, source_val, target_val))
 
     params_match = len(param_differences) == 0
-    validation_results.append({
-        'check': 'Oracle DB Parameters Match',
-        'status': 'PASS' if params_match else 'FAILED',
-        'source_value': f"{len(source_params)} parameters",
-        'target_value': f"{len(target_params)} parameters ({len(param_differences)} differences)"
-    })
+    validation_results.append(CheckResult(
+        check='Oracle DB Parameters Match',
+        status='PASS' if params_match else 'FAILED',
+        source_value=f"{len(source_params)} parameters",
+        target_value=f"{len(target_params)} parameters ({len(param_differences)} differences)"
+    ))
 
     # Check DB services
     emit_progress("Checking DB services...")
-    source_cursor.execute("""
-        SELECT name, pdb
-        FROM cdb_services
-        WHERE UPPER(pdb) = UPPER(:pdb_name)
-        ORDER BY name
-    """, pdb_name=source_pdb)
-    source_services = source_cursor.fetchall()
-    source_data['services'] = source_services
-
-    target_cursor.execute("""
-        SELECT name, pdb
-        FROM cdb_services
-        WHERE UPPER(pdb) = UPPER(:pdb_name)
-        ORDER BY name
-    """, pdb_name=target_pdb)
-    target_services = target_cursor.fetchall()
-    target_data['services'] = target_services
 
     source_service_names = set([s[0] for s in source_services])
     target_service_names = set([s[0] for s in target_services])
@@ -1157,17 +1391,12 @@ def perform_pdb_postcheck(params, progress_callback=None):
     # Allow for PDB name differences in service names
     services_match = len(source_service_names) == len(target_service_names)
 
-    validation_results.append({
-        'check': 'DB Service Names Match',
-        'status': 'PASS' if services_match else 'FAILED',
-        'source_value': f"{len(source_service_names)} services",
-        'target_value': f"{len(target_service_names)} services"
-    })
-
-    source_cursor.close()
-    target_cursor.close()
-    source_conn.close()
-    target_conn.close()
+    validation_results.append(CheckResult(
+        check='DB Service Names Match',
+        status='PASS' if services_match else 'FAILED',
+        source_value=f"{len(source_service_names)} services",
+        target_value=f"{len(target_service_names)} services"
+    ))
 
     emit_progress("Postcheck validation completed")
 
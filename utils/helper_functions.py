@@ -12,9 +12,13 @@ Extracted from oracle_pdb_toolkit.py:
 
 import os
 import platform
+import re
+import signal
+import socket
 import traceback
+from functools import lru_cache
 from typing import Optional, Tuple, Union
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, QSocketNotifier, pyqtSignal
 import oracledb
 
 
@@ -153,6 +157,41 @@ def _init_oracle_client_unix() -> Tuple[bool, str]:
         return False, f"Oracle Client initialization failed: {e}"
 
 
+def install_signal_wakeup(app) -> None:
+    """
+    Wake the Qt event loop when a POSIX signal (e.g. Ctrl+C) arrives.
+
+    Python only runs signal handlers between bytecodes, while an idle Qt event
+    loop sits in C++. signal.set_wakeup_fd() writes a byte to one end of a
+    socketpair on every signal; a QSocketNotifier on the other end wakes the
+    loop, and the Python handler runs as the notifier slot executes. This
+    replaces a periodic no-op QTimer, so the process takes no wakeups while idle.
+
+    Args:
+        app: The QApplication; the sockets and notifier are kept alive on it.
+    """
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    wsock.setblocking(False)
+    signal.set_wakeup_fd(wsock.fileno())
+
+    def _drain(*_args):
+        try:
+            rsock.recv(4096)
+        except OSError:
+            pass
+
+    notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Type.Read, app)
+    notifier.activated.connect(_drain)
+    app._signal_wakeup = (rsock, wsock, notifier)
+
+
+# Oracle storage strings: a number with an optional G/M/T suffix (no suffix means bytes)
+_STORAGE_RE = re.compile(r'^\s*([0-9]*\.?[0-9]+)\s*([GMT]?)\s*$', re.IGNORECASE)
+_UNIT_TO_GB = {'G': 1.0, 'M': 1.0 / 1024, 'T': 1024.0, '': 1.0 / (1024 ** 3)}
+
+
+@lru_cache(maxsize=64)
 def parse_storage_value(storage_str: str) -> Optional[float]:
     """
     Parse Oracle storage value string to GB (float).
@@ -183,35 +222,13 @@ def parse_storage_value(storage_str: str) -> Optional[float]:
     if not storage_str:
         return None
 
-    storage_str_upper = storage_str.upper().strip()
-
-    # Check for UNLIMITED
-    if storage_str_upper == 'UNLIMITED':
+    # UNLIMITED and anything unparseable fail the match
+    match = _STORAGE_RE.match(storage_str)
+    if match is None:
         return None
 
-    try:
-        # Check for gigabytes (G)
-        if 'G' in storage_str_upper:
-            return float(storage_str_upper.replace('G', ''))
-
-        # Check for megabytes (M)
-        elif 'M' in storage_str_upper:
-            mb_val = float(storage_str_upper.replace('M', ''))
-            return mb_val / 1024
-
-        # Check for terabytes (T)
-        elif 'T' in storage_str_upper:
-            tb_val = float(storage_str_upper.replace('T', ''))
-            return tb_val * 1024
-
-        # Assume bytes if no unit specified
-        else:
-            bytes_val = float(storage_str_upper)
-            return bytes_val / (1024**3)
-
-    except (ValueError, AttributeError):
-        # Return None if parsing fails
-        return None
+    number, unit = match.groups()
+    return float(number) * _UNIT_TO_GB[unit.upper()]
 
 
 def format_storage_gb(gb_value: Optional[float], unlimited_text: str = 'UNLIMITED') -> str:
@@ -7,13 +7,107 @@ This module provides HTML report generation functions for:
 - PDB clone precheck validation reports
 - PDB clone postcheck validation reports
 
-All reports use the report_styles.css file and auto-open in the default browser.
+All reports inline report_styles.css and auto-open in the default browser.
 Reports are saved to the outputs/ directory.
 """
 
 import os
-import webbrowser
+import threading
 from datetime import datetime
+from html import escape
+from itertools import starmap, zip_longest
+from operator import attrgetter, itemgetter
+from pathlib import Path
+
+
+# report_styles.css (repo root) is read once at import and inlined into every report,
+# falling back to the relative link used from outputs/ if it cannot be read
+_CSS_PATH = Path(__file__).resolve().parent.parent / 'report_styles.css'
+try:
+    _REPORT_STYLE = f"    <style>\n{_CSS_PATH.read_text(encoding='utf-8')}    </style>\n"
+except OSError:
+    _REPORT_STYLE = '    <link rel="stylesheet" href="../report_styles.css">\n'
+
+# Validation result row, parsed once and filled per result via format_map
+_STATUS_CLASS = {'PASS': 'pass'}
+_VALIDATION_ROW_TPL = """        <tr>
+            <td>{check}</td>
+            <td class="{cls}">{status}</td>
+            <td>{src}</td>
+            <td>{tgt}</td>
+        </tr>\n"""
+_PARAM_ROW_TPL = """        <tr class="{cls}">
+            <td>{param}</td>
+            <td>{src}</td>
+            <td>{tgt}</td>
+            <td>{status}</td>
+        </tr>\n"""
+_PARAM_DIFF_ROW_TPL = """        <tr class="diff">
+            <td>{}</td>
+            <td>{}</td>
+            <td>{}</td>
+        </tr>\n"""
+
+
+def _param_rows(all_params, source_params, target_params, source_missing, target_missing, compare=True):
+    """
+    Render parameter comparison rows as one string.
+
+    Rows are produced by a generator and joined in a single str.join pass.
+    With compare=False (target PDB not created yet) every row is left
+    unstyled with a 'Pending' status.
+    """
+    # Escape each side's values in one pass up front, then bind the lookups once
+    src_get = dict(zip(source_params, map(escape, map(str, source_params.values())))).get
+    tgt_get = dict(zip(target_params, map(escape, map(str, target_params.values())))).get
+    rows = ((param, src_get(param, source_missing), tgt_get(param, target_missing)) for param in all_params)
+    if not compare:
+        return "".join(_PARAM_ROW_TPL.format(cls='', param=param, src=src, tgt=tgt, status='Pending')
+                       for param, src, tgt in rows)
+    return "".join(
+        _PARAM_ROW_TPL.format(cls='match', param=param, src=src, tgt=tgt, status='SAME') if src == tgt
+        else _PARAM_ROW_TPL.format(cls='diff', param=param, src=src, tgt=tgt, status='DIFF')
+        for param, src, tgt in rows
+    )
+
+
+def _escape_column(rows, key):
+    """HTML-escape one attribute of a list of CheckResult rows in a single map pass"""
+    return map(escape, map(str, map(attrgetter(key), rows)))
+
+
+def _instance_info(inst):
+    """Format one (inst_id, instance_name, host_name) row with the names HTML-escaped"""
+    return f"Instance {inst[0]}: {escape(str(inst[1]))} @ {escape(str(inst[2]))}" if inst else "N/A"
+
+
+def _open_in_browser(report_path):
+    """
+    Open a saved report (an absolute Path) in the default browser without blocking the caller.
+
+    The browser spawn runs on a daemon thread so the Qt UI thread is not held
+    up; set PDB_TOOLKIT_NO_OPEN to skip it entirely (CI / headless runs).
+    """
+    if os.environ.get('PDB_TOOLKIT_NO_OPEN'):
+        return
+    try:
+        # Imported on first use: only needed once a report exists, keeps it off the startup path
+        import webbrowser
+        threading.Thread(target=webbrowser.open, args=(report_path.as_uri(),), daemon=True).start()
+    except Exception:
+        # If auto-open fails, just continue (report is still saved)
+        pass
+
+
+def _param_dict(data, key):
+    """
+    Return data[key] parameter rows as a {name: value} dict.
+
+    Rows are (name, value, isdefault) tuples; the dict is built in C via
+    dict(map(itemgetter(0, 1), rows)). ``data`` itself is left untouched.
+    """
+    rows = data.get(key, [])
+    return rows if isinstance(rows, dict) else dict(map(itemgetter(0, 1), rows))
 
 
 def generate_health_report(health_data, output_dir='outputs'):
@@ -46,28 +140,25 @@ def generate_health_report(health_data, output_dir='outputs'):
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     db_name = health_data.get('db_name', 'UNKNOWN').replace(':', '_').replace('/', '_')
     filename = os.path.join(output_dir, f"{db_name}_db_health_report_{timestamp}.html")
 
-    # Get CSS file path
-    css_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'report_styles.css')
-
     html = f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Database Health Check Report</title>
-    <link rel="stylesheet" href="../report_styles.css">
-</head>
+{_REPORT_STYLE}</head>
 <body>
     <h1>Oracle Database Health Check Report</h1>
-    <div class="timestamp">Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</div>
+    <div class="timestamp">Generated: {now.strftime("%Y-%m-%d %H:%M:%S")}</div>
 
     <h2>Database Information</h2>
     <div class="info-box">
-        <p><strong>Database Name:</strong> {health_data['db_name']}</p>
+        <p><strong>Database Name:</strong> {escape(str(health_data['db_name']))}</p>
         <p><strong>Open Mode:</strong> {health_data['open_mode']}</p>
         <p><strong>Role:</strong> {health_data['role']}</p>
         <p><strong>Version:</strong> {health_data['version']}</p>
@@ -77,7 +168,7 @@ def generate_health_report(health_data, output_dir='outputs'):
     instances = health_data.get('instances', [])
     if instances:
         for inst in instances:
-            html += f"        <p><strong>Instance {inst[0]}:</strong> {inst[1]} @ {inst[2]}</p>\n"
+            html += f"        <p><strong>Instance {inst[0]}:</strong> {escape(str(inst[1]))} @ {escape(str(inst[2]))}</p>\n"
 
     # Add DB size
     db_size_gb = health_data.get('db_size_gb', 0)
@@ -363,19 +454,14 @@ def generate_health_report(health_data, output_dir='outputs'):
 </html>
 """
 
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(html)
-
-    report_path = os.path.abspath(filename)
+    # Resolve the absolute path once; it is both written and handed to the browser
+    report_path = Path.cwd() / filename
+    report_path.write_text(html, encoding='utf-8')
 
     # Auto-open the HTML report in default browser
-    try:
-        webbrowser.open('file://' + report_path)
-    except Exception:
-        # If auto-open fails, just continue (report is still saved)
-        pass
+    _open_in_browser(report_path)
 
-    return report_path
+    return str(report_path)
 
 
 def generate_precheck_report(source_cdb, source_pdb, target_cdb, target_pdb,
@@ -388,7 +474,7 @@ def generate_precheck_report(source_cdb, source_pdb, target_cdb, target_pdb,
         source_pdb (str): Source PDB name
         target_cdb (str): Target CDB name
         target_pdb (str): Target PDB name
-        validation_results (list): List of validation check dictionaries
+        validation_results (list): List of pdb_clone.CheckResult rows
         source_data (dict): Source database metadata
         target_data (dict): Target database metadata
         output_dir (str): Directory to save report (default: 'outputs')
@@ -399,185 +485,143 @@ def generate_precheck_report(source_cdb, source_pdb, target_cdb, target_pdb,
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     filename = os.path.join(output_dir, f"{source_cdb}_{source_pdb}_{target_cdb}_{target_pdb}_pdb_validation_report_{timestamp}.html")
 
     # Calculate overall status
-    overall_pass = all(r['status'] == 'PASS' for r in validation_results if r['status'] != 'SKIPPED')
+    overall_pass = all(r.status == 'PASS' for r in validation_results if r.status != 'SKIPPED')
     overall_status = 'PASS' if overall_pass else 'FAIL'
     overall_class = 'pass' if overall_pass else 'fail'
 
-    html = f"""<!DOCTYPE html>
+    parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>PDB Clone Validation Report</title>
-    <link rel="stylesheet" href="../report_styles.css">
-</head>
+{_REPORT_STYLE}</head>
 <body>
     <h1>PDB Clone Validation Report (Precheck) - <span class="{overall_class}">{overall_status}</span></h1>
-    <div class="timestamp">Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</div>
+    <div class="timestamp">Generated: {now.strftime("%Y-%m-%d %H:%M:%S")}</div>
 
     <h2>Section 1: Connection Metadata</h2>
     <table>
         <tr><th>Component</th><th>Source</th><th>Target</th></tr>
-        <tr><td>CDB</td><td>{source_cdb}</td><td>{target_cdb}</td></tr>
-        <tr><td>PDB</td><td>{source_pdb}</td><td>{target_pdb}</td></tr>
-"""
+        <tr><td>CDB</td><td>{escape(str(source_cdb))}</td><td>{escape(str(target_cdb))}</td></tr>
+        <tr><td>PDB</td><td>{escape(str(source_pdb))}</td><td>{escape(str(target_pdb))}</td></tr>
+"""]
 
     # Add instance information
     source_instances = source_data.get('instances', [])
     target_instances = target_data.get('instances', [])
 
     if source_instances or target_instances:
-        html += "        <tr><td colspan='3' style='background-color: #f0f0f0; font-weight: bold;'>Instance Information</td></tr>\n"
-
-    max_instances = max(len(source_instances), len(target_instances))
-    for i in range(max_instances):
-        if i < len(source_instances):
-            src_inst = source_instances[i]
-            source_info = f"Instance {src_inst[0]}: {src_inst[1]} @ {src_inst[2]}"
-        else:
-            source_info = "N/A"
+        parts.append("        <tr><td colspan='3' style='background-color: #f0f0f0; font-weight: bold;'>Instance Information</td></tr>\n")
 
-        if i < len(target_instances):
-            tgt_inst = target_instances[i]
-            target_info = f"Instance {tgt_inst[0]}: {tgt_inst[1]} @ {tgt_inst[2]}"
-        else:
-            target_info = "N/A"
-
-        html += f"        <tr><td>Instance {i+1}</td><td>{source_info}</td><td>{target_info}</td></tr>\n"
+    for i, (src_inst, tgt_inst) in enumerate(zip_longest(source_instances, target_instances), start=1):
+        source_info = _instance_info(src_inst)
+        target_info = _instance_info(tgt_inst)
+        parts.append(f"        <tr><td>Instance {i}</td><td>{source_info}</td><td>{target_info}</td></tr>\n")
 
     # Add PDB size information
     source_pdb_size = source_data.get('pdb_size_gb', 0)
     target_pdb_size = target_data.get('pdb_size_gb', 0)
 
-    html += "        <tr><td colspan='3' style='background-color: #f0f0f0; font-weight: bold;'>PDB Size Information</td></tr>\n"
-    html += f"        <tr><td>PDB Total Size (GB)</td><td>{source_pdb_size} GB</td><td>{target_pdb_size if target_pdb_size > 0 else 'N/A (PDB not created yet)'}</td></tr>\n"
+    parts.append("        <tr><td colspan='3' style='background-color: #f0f0f0; font-weight: bold;'>PDB Size Information</td></tr>\n")
+    parts.append(f"        <tr><td>PDB Total Size (GB)</td><td>{source_pdb_size} GB</td><td>{target_pdb_size if target_pdb_size > 0 else 'N/A (PDB not created yet)'}</td></tr>\n")
 
-    html += """
+    parts.append("""
     </table>
 
     <h2>Section 2: Verification Checks</h2>
     <table>
         <tr><th>Check</th><th>Status</th><th>Source Value</th><th>Target Value</th></tr>
-"""
-
-    for result in validation_results:
-        status_class = 'pass' if result['status'] == 'PASS' else 'fail'
-        html += f"""        <tr>
-            <td>{result['check']}</td>
-            <td class="{status_class}">{result['status']}</td>
-            <td>{result['source_value']}</td>
-            <td>{result['target_value']}</td>
-        </tr>\n"""
+""")
+
+    source_values = _escape_column(validation_results, 'source_value')
+    target_values = _escape_column(validation_results, 'target_value')
+    for result, source_value, target_value in zip(validation_results, source_values, target_values):
+        parts.append(_VALIDATION_ROW_TPL.format_map({
+            'check': result.check,
+            'cls': _STATUS_CLASS.get(result.status, 'fail'),
+            'status': result.status,
+            'src': source_value,
+            'tgt': target_value,
+        }))
 
         # Add violation details if present
-        if 'violations' in result and result['violations']:
-            html += """        <tr><td colspan="4"><div class="violations">
+        if result.violations:
+            parts.append("""        <tr><td colspan="4"><div class="violations">
                 <strong>Plug-In Violations Detected:</strong><br>
-"""
-            for v in result['violations']:
-                html += f"                &bull; {v[0]} - {v[3]}<br>\n"
-            html += "            </div></td></tr>\n"
+""")
+            parts.append("".join(f"                &bull; {escape(str(v[0]))} - {escape(str(v[3]))}<br>\n"
+                                 for v in result.violations))
+            parts.append("            </div></td></tr>\n")
 
-    html += """
+    parts.append("""
     </table>
 
     <h2>Section 3: ORACLE CDB Parameters Comparison (Non-Default)</h2>
     <table>
         <tr><th>Parameter Name</th><th>Source Value</th><th>Target Value</th><th>Status</th></tr>
-"""
+""")
 
     # Build CDB parameter comparison
-    source_cdb_params = {p[0]: p[1] for p in source_data.get('cdb_parameters', [])}
-    target_cdb_params = {p[0]: p[1] for p in target_data.get('cdb_parameters', [])}
+    source_cdb_params = _param_dict(source_data, 'cdb_parameters')
+    target_cdb_params = _param_dict(target_data, 'cdb_parameters')
 
-    all_cdb_params = sorted(set(source_cdb_params.keys()) | set(target_cdb_params.keys()))
+    all_cdb_params = sorted(source_cdb_params.keys() | target_cdb_params.keys())
 
-    for param in all_cdb_params:
-        source_val = source_cdb_params.get(param, 'N/A')
-        target_val = target_cdb_params.get(param, 'N/A')
+    parts.append(_param_rows(all_cdb_params, source_cdb_params, target_cdb_params, 'N/A', 'N/A'))
 
-        if source_val == target_val:
-            row_class = 'match'
-            status = 'SAME'
-        else:
-            row_class = 'diff'
-            status = 'DIFF'
-
-        html += f"""        <tr class="{row_class}">
-            <td>{param}</td>
-            <td>{source_val}</td>
-            <td>{target_val}</td>
-            <td>{status}</td>
-        </tr>\n"""
-
-    html += """
+    parts.append("""
     </table>
 
     <h2>Section 4: ORACLE PDB Parameters Comparison (Non-Default)</h2>
-"""
+""")
 
     # Build PDB parameter comparison
-    source_pdb_params = {p[0]: p[1] for p in source_data.get('pdb_parameters', [])}
-    target_pdb_params = {p[0]: p[1] for p in target_data.get('pdb_parameters', [])}
+    source_pdb_params = _param_dict(source_data, 'pdb_parameters')
+    target_pdb_params = _param_dict(target_data, 'pdb_parameters')
 
-    all_pdb_params = sorted(set(source_pdb_params.keys()) | set(target_pdb_params.keys()))
+    all_pdb_params = sorted(source_pdb_params.keys() | target_pdb_params.keys())
 
     # Check if target PDB exists (has parameters)
     target_pdb_exists = len(target_pdb_params) > 0
     target_pdb_mode = target_data.get('pdb_mode', 'Unknown')
 
     if not target_pdb_exists:
-        html += """
+        parts.append("""
     <p style="background-color: #fff3cd; padding: 10px; border-left: 4px solid #ffc107; margin: 10px 0;">
         <strong>Note:</strong> Target PDB does not exist yet.
         The table below shows source PDB parameters that will be inherited after cloning.
         Run postcheck after cloning to compare actual parameter values.
     </p>
-"""
+""")
     else:
-        html += f"""
+        parts.append(f"""
     <p style="background-color: #d1ecf1; padding: 10px; border-left: 4px solid #0c5460; margin: 10px 0;">
-        <strong>Note:</strong> Target PDB exists ({target_pdb_mode}).
+        <strong>Note:</strong> Target PDB exists ({escape(str(target_pdb_mode))}).
         Comparing current parameter values between source and target PDBs.
     </p>
-"""
+""")
 
-    html += """
+    parts.append("""
     <table>
         <tr><th>Parameter Name</th><th>Source PDB Value</th><th>Target PDB Value</th><th>Status</th></tr>
-"""
+""")
 
     if all_pdb_params:
-        for param in all_pdb_params:
-            source_val = source_pdb_params.get(param, 'Not Set')
-            target_val = target_pdb_params.get(param, 'Not Set' if target_pdb_exists else 'PDB not created yet')
-
-            if source_val == target_val and target_pdb_exists:
-                row_class = 'match'
-                status = 'SAME'
-            elif not target_pdb_exists:
-                row_class = ''  # No color for pending parameters
-                status = 'Pending'
-            else:
-                row_class = 'diff'
-                status = 'DIFF'
-
-            html += f"""        <tr class="{row_class}">
-            <td>{param}</td>
-            <td>{source_val}</td>
-            <td>{target_val}</td>
-            <td>{status}</td>
-        </tr>\n"""
+        parts.append(_param_rows(all_pdb_params, source_pdb_params, target_pdb_params, 'Not Set',
+                                 'Not Set' if target_pdb_exists else 'PDB not created yet',
+                                 compare=target_pdb_exists))
     else:
-        html += """        <tr>
+        parts.append("""        <tr>
             <td colspan="4" style="text-align: center; font-style: italic;">No non-default PDB parameters found on either source or target</td>
-        </tr>\n"""
+        </tr>\n""")
 
-    html += """
+    parts.append("""
     </table>
 
     <div class="footer">
@@ -585,21 +629,18 @@ def generate_precheck_report(source_cdb, source_pdb, target_cdb, target_pdb,
     </div>
 </body>
 </html>
-"""
+""")
 
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(html)
+    html = "".join(parts)
 
-    report_path = os.path.abspath(filename)
+    # Resolve the absolute path once; it is both written and handed to the browser
+    report_path = Path.cwd() / filename
+    report_path.write_text(html, encoding='utf-8')
 
     # Auto-open the HTML report in default browser
-    try:
-        webbrowser.open('file://' + report_path)
-    except Exception:
-        # If auto-open fails, just continue (report is still saved)
-        pass
+    _open_in_browser(report_path)
 
-    return report_path
+    return str(report_path)
 
 
 def generate_postcheck_report(source_cdb, source_pdb, target_cdb, target_pdb,
@@ -612,7 +653,7 @@ def generate_postcheck_report(source_cdb, source_pdb, target_cdb, target_pdb,
         source_pdb (str): Source PDB name
         target_cdb (str): Target CDB name
         target_pdb (str): Target PDB name
-        validation_results (list): List of validation check dictionaries
+        validation_results (list): List of pdb_clone.CheckResult rows
         source_data (dict): Source database metadata
         target_data (dict): Target database metadata
         param_diffs (list): List of parameter differences
@@ -624,113 +665,96 @@ def generate_postcheck_report(source_cdb, source_pdb, target_cdb, target_pdb,
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     filename = os.path.join(output_dir, f"{source_cdb}_{source_pdb}_{target_cdb}_{target_pdb}_pdb_postcheck_report_{timestamp}.html")
 
-    html = f"""<!DOCTYPE html>
+    parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>PDB Clone Postcheck Report</title>
-    <link rel="stylesheet" href="../report_styles.css">
-</head>
+{_REPORT_STYLE}</head>
 <body>
     <h1>PDB Clone Postcheck Report</h1>
-    <div class="timestamp">Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</div>
+    <div class="timestamp">Generated: {now.strftime("%Y-%m-%d %H:%M:%S")}</div>
 
     <h2>Section 1: Connection Metadata</h2>
     <table>
         <tr><th>Component</th><th>Source</th><th>Target</th></tr>
-        <tr><td>CDB</td><td>{source_cdb}</td><td>{target_cdb}</td></tr>
-        <tr><td>PDB</td><td>{source_pdb}</td><td>{target_pdb}</td></tr>
-"""
+        <tr><td>CDB</td><td>{escape(str(source_cdb))}</td><td>{escape(str(target_cdb))}</td></tr>
+        <tr><td>PDB</td><td>{escape(str(source_pdb))}</td><td>{escape(str(target_pdb))}</td></tr>
+"""]
 
     # Add instance information
     source_instances = source_data.get('instances', [])
     target_instances = target_data.get('instances', [])
 
     if source_instances or target_instances:
-        html += "        <tr><td colspan='3' style='background-color: #f0f0f0; font-weight: bold;'>Instance Information</td></tr>\n"
+        parts.append("        <tr><td colspan='3' style='background-color: #f0f0f0; font-weight: bold;'>Instance Information</td></tr>\n")
 
-    max_instances = max(len(source_instances), len(target_instances))
-    for i in range(max_instances):
-        if i < len(source_instances):
-            src_inst = source_instances[i]
-            source_info = f"Instance {src_inst[0]}: {src_inst[1]} @ {src_inst[2]}"
-        else:
-            source_info = "N/A"
-
-        if i < len(target_instances):
-            tgt_inst = target_instances[i]
-            target_info = f"Instance {tgt_inst[0]}: {tgt_inst[1]} @ {tgt_inst[2]}"
-        else:
-            target_info = "N/A"
-
-        html += f"        <tr><td>Instance {i+1}</td><td>{source_info}</td><td>{target_info}</td></tr>\n"
+    for i, (src_inst, tgt_inst) in enumerate(zip_longest(source_instances, target_instances), start=1):
+        source_info = _instance_info(src_inst)
+        target_info = _instance_info(tgt_inst)
+        parts.append(f"        <tr><td>Instance {i}</td><td>{source_info}</td><td>{target_info}</td></tr>\n")
 
     # Add PDB size information
     source_pdb_size = source_data.get('pdb_size_gb', 0)
     target_pdb_size = target_data.get('pdb_size_gb', 0)
 
-    html += "        <tr><td colspan='3' style='background-color: #f0f0f0; font-weight: bold;'>PDB Size Information</td></tr>\n"
-    html += f"        <tr><td>PDB Total Size (GB)</td><td>{source_pdb_size} GB</td><td>{target_pdb_size} GB</td></tr>\n"
+    parts.append("        <tr><td colspan='3' style='background-color: #f0f0f0; font-weight: bold;'>PDB Size Information</td></tr>\n")
+    parts.append(f"        <tr><td>PDB Total Size (GB)</td><td>{source_pdb_size} GB</td><td>{target_pdb_size} GB</td></tr>\n")
 
-    html += """
+    parts.append("""
     </table>
 
     <h2>Section 2: Postcheck Verification</h2>
     <table>
         <tr><th>Check</th><th>Status</th><th>Source Value</th><th>Target Value</th></tr>
-"""
-
-    for result in validation_results:
-        status_class = 'pass' if result['status'] == 'PASS' else 'fail'
-        html += f"""        <tr>
-            <td>{result['check']}</td>
-            <td class="{status_class}">{result['status']}</td>
-            <td>{result['source_value']}</td>
-            <td>{result['target_value']}</td>
-        </tr>\n"""
-
-    html += """
+""")
+
+    source_values = _escape_column(validation_results, 'source_value')
+    target_values = _escape_column(validation_results, 'target_value')
+    for result, source_value, target_value in zip(validation_results, source_values, target_values):
+        parts.append(_VALIDATION_ROW_TPL.format_map({
+            'check': result.check,
+            'cls': _STATUS_CLASS.get(result.status, 'fail'),
+            'status': result.status,
+            'src': source_value,
+            'tgt': target_value,
+        }))
+
+    parts.append("""
     </table>
 
     <h2>Section 3: Parameter Differences</h2>
-"""
+""")
 
     if param_diffs:
-        html += """    <table>
+        parts.append("""    <table>
         <tr><th>Parameter Name</th><th>Source Value</th><th>Target Value</th></tr>
-"""
-        for param, source_val, target_val in param_diffs:
-            html += f"""        <tr class="diff">
-            <td>{param}</td>
-            <td>{source_val}</td>
-            <td>{target_val}</td>
-        </tr>\n"""
-        html += "    </table>\n"
+""")
+        parts.append("".join(starmap(_PARAM_DIFF_ROW_TPL.format, (map(escape, map(str, diff)) for diff in param_diffs))))
+        parts.append("    </table>\n")
     else:
-        html += "    <div class='alert-success'>All parameters match!</div>\n"
+        parts.append("    <div class='alert-success'>All parameters match!</div>\n")
 
-    html += """
+    parts.append("""
     <div class="footer">
         <p>Generated by Oracle PDB Management Toolkit</p>
     </div>
 </body>
 </html>
-"""
+""")
 
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(html)
+    html = "".join(parts)
 
-    report_path = os.path.abspath(filename)
+    # Resolve the absolute path once; it is both written and handed to the browser
+    report_path = Path.cwd() / filename
+    report_path.write_text(html, encoding='utf-8')
 
     # Auto-open the HTML report in default browser
-    try:
-        webbrowser.open('file://' + report_path)
-    except Exception:
-        # If auto-open fails, just continue (report is still saved)
-        pass
+    _open_in_browser(report_path)
 
-    return report_path
+    return str(report_path)